@@ -0,0 +1,352 @@
+"""
+Build unificado do conteudo.
+
+Executa as quatro trilhas (HTML, CSS, JavaScript e C#) num unico processo,
+calcula o SHA-256 de cada registro renderizado e so reescreve os arquivos de
+challenges/ cujos bytes realmente mudaram. Arquivos intactos mantem o mtime,
+o que preserva os caches e evita que o importador releia tudo.
+
+Uso:
+    python build.py            # aplica as mudancas
+    python build.py --plan     # dry-run: lista ids adicionados/alterados/removidos
+    python build.py --prune    # aplica e apaga os arquivos removidos
+    python build.py --jobs 4   # renderiza trilha x dificuldade em 4 processos
+    python build.py --bundle challenges.bundle   # tambem gera o bundle unico
+    python build.py --seed codegym.db            # tambem gera o banco SQLite de seed
+    python build.py --search search.json         # tambem gera o indice de busca
+    python build.py --facets facets.json         # tambem gera o indice de facetas (bitmaps)
+    python build.py --markdown descriptions.json  # descricoes pre-renderadas em HTML, por hash do texto
+    python build.py --zip pacote.zip [--assets DIR]  # tambem gera o .zip importavel
+    python build.py --previews DIR               # documentos de preview de HTML/CSS
+    python build.py --catalog DIR                # catalog.json leve + details/{id}.json
+    python build.py --verify   # regras HTML/CSS x referenceSolution, testCode expandido x compacto,
+                               # exemplos de Markdown e contadores das facetas (sai com 1 se falhar)
+
+Ao final o manifest.json e regenerado a partir do que ficou em challenges/,
+com SHA-256 e tamanho de cada desafio e um digest do pacote inteiro.
+
+"Removidos" sao os ids que o build anterior gerou e que nenhum gerador produz
+mais (registrados em .build-state.json). Desafios escritos a mao em
+challenges/ nunca sao tocados.
+"""
+import argparse
+import hashlib
+import importlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import bundle
+import catalog
+import facet_index
+import markdown_render
+import package_zip
+import preview
+import rule_verifier
+import search_index
+import seed_db
+import template_verifier
+import templates
+import generate_challenges
+import generate_css
+import generate_js
+import generate_csharp
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUT = os.path.join(ROOT, "challenges")
+MANIFEST = os.path.join(ROOT, "manifest.json")
+STATE = os.path.join(ROOT, ".build-state.json")
+MARKDOWN_CACHE = os.path.join(ROOT, ".markdown-cache.json")
+PREVIEW_CACHE = os.path.join(ROOT, ".preview-cache.json")
+
+# (trilha, modulo gerador) na ordem em que os geradores eram executados
+TRACKS = [
+    ("html", generate_challenges),
+    ("css", generate_css),
+    ("javascript", generate_js),
+    ("csharp", generate_csharp),
+]
+
+DIFFICULTIES = ["Iniciante", "Intermediario", "Avancado"]
+
+
+def render(data):
+    """Serializa um registro com os mesmos bytes que o save() dos geradores."""
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def digest(blob):
+    return hashlib.sha256(blob).hexdigest()
+
+
+def render_block(module_name, difficulty):
+    """
+    Renderiza um bloco trilha x dificuldade. Roda dentro dos workers.
+
+    Retorna [(id, registro compacto, bytes do arquivo)]. O arquivo leva o
+    testCode expandido; o registro compacto guarda so a referencia ao template.
+    """
+    module = importlib.import_module(module_name)
+    return [(data["id"], data, render(templates.expand(data))) for data in module.records(difficulty)]
+
+
+def generate(jobs=1):
+    """
+    Renderiza todas as trilhas. Retorna ({id: bytes}, {id: registro compacto}),
+    ambos na ordem de geracao.
+
+    Com jobs > 1 cada bloco trilha x dificuldade vai para um processo do pool.
+    Os blocos sao juntados na ordem da lista de tarefas (e nao na ordem em que
+    terminam), entao a saida e identica para qualquer numero de workers.
+    """
+    tasks = [(module.__name__, diff) for _, module in TRACKS for diff in DIFFICULTIES]
+    if jobs == 1:
+        blocks = [render_block(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs or None) as pool:
+            blocks = list(pool.map(render_block, *zip(*tasks)))
+
+    rendered = {}
+    records = {}
+    for items in blocks:
+        for cid, data, blob in items:
+            rendered[cid] = blob
+            records[cid] = data
+    return rendered, records
+
+
+def read_bytes(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def write_atomic(path, blob):
+    """Grava via arquivo temporario para nunca deixar um JSON pela metade."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, path)
+
+
+def write_if_changed(path, blob):
+    """Grava blob em path apenas se os bytes diferirem do que ja esta no disco."""
+    current = read_bytes(path)
+    if current is not None and digest(current) == digest(blob):
+        return False
+    write_atomic(path, blob)
+    return True
+
+
+def load_state():
+    blob = read_bytes(STATE)
+    if blob is None:
+        return {}
+    return json.loads(blob.decode("utf-8")).get("challenges", {})
+
+
+def plan(rendered, previous):
+    """Compara os registros renderizados com o disco e com o build anterior."""
+    result = {"added": [], "changed": [], "unchanged": [], "removed": []}
+    for cid, blob in rendered.items():
+        current = read_bytes(os.path.join(OUT, f"{cid}.json"))
+        if current is None:
+            result["added"].append(cid)
+        elif digest(current) != digest(blob):
+            result["changed"].append(cid)
+        else:
+            result["unchanged"].append(cid)
+    result["removed"] = sorted(cid for cid in previous if cid not in rendered)
+    return result
+
+
+def apply(rendered, changes, prune=False):
+    os.makedirs(OUT, exist_ok=True)
+    for cid in changes["added"] + changes["changed"]:
+        write_atomic(os.path.join(OUT, f"{cid}.json"), rendered[cid])
+    if prune:
+        for cid in changes["removed"]:
+            path = os.path.join(OUT, f"{cid}.json")
+            if os.path.exists(path):
+                os.remove(path)
+    state = {"challenges": {cid: digest(blob) for cid, blob in sorted(rendered.items())}}
+    write_if_changed(STATE, render(state))
+
+
+def pack_files(rendered, changes, prune=False):
+    """
+    Conteudo final de challenges/: os registros gerados mais os arquivos
+    escritos a mao (ou removidos sem --prune) que continuam no disco.
+    """
+    files = dict(rendered)
+    pruned = set(changes["removed"]) if prune else set()
+    if os.path.isdir(OUT):
+        for name in sorted(os.listdir(OUT)):
+            cid, ext = os.path.splitext(name)
+            if ext == ".json" and cid not in files and cid not in pruned:
+                files[cid] = read_bytes(os.path.join(OUT, name))
+    return files
+
+
+def build_manifest(files, meta=None):
+    """
+    Monta o manifesto do pacote a partir dos bytes de cada desafio.
+
+    Os metadados (name, version, description, author) vem do manifesto atual.
+    O digest do pacote e o SHA-256 das linhas "id sha256 tamanho", em ordem
+    de id, entao so muda quando algum desafio muda.
+    """
+    meta = meta or {}
+    ids = sorted(files)
+    checksums = {cid: {"sha256": digest(files[cid]), "size": len(files[cid])} for cid in ids}
+    tracks = {json.loads(files[cid].decode("utf-8"))["track"] for cid in ids}
+    lines = "".join(f"{cid} {checksums[cid]['sha256']} {checksums[cid]['size']}\n" for cid in ids)
+    return {
+        "name": meta.get("name", "Pacote Completo"),
+        "version": meta.get("version", "1.0.0"),
+        "description": meta.get("description", ""),
+        "author": meta.get("author", ""),
+        "tracks": [name for name, _ in TRACKS if name in tracks],
+        "challenges": ids,
+        "checksums": checksums,
+        "digest": digest(lines.encode("utf-8")),
+    }
+
+
+def load_manifest():
+    blob = read_bytes(MANIFEST)
+    return json.loads(blob.decode("utf-8")) if blob is not None else {}
+
+
+def write_previews(out_dir, records):
+    """Grava {id}.html para cada desafio de HTML/CSS e apaga os que sobraram."""
+    cache = preview.PreviewCache.load(PREVIEW_CACHE)
+    previews = preview.render_previews(records, cache)
+    write_if_changed(PREVIEW_CACHE, cache.to_bytes())
+
+    os.makedirs(out_dir, exist_ok=True)
+    written = sum(write_if_changed(os.path.join(out_dir, f"{cid}.html"), doc) for cid, doc in previews.items())
+    for name in os.listdir(out_dir):
+        cid, ext = os.path.splitext(name)
+        if ext == ".html" and cid not in previews:
+            os.remove(os.path.join(out_dir, name))
+    return written, cache.misses
+
+
+def write_catalog(out_dir, records):
+    """Grava catalog.json e details/{id}.json e apaga os detalhes que sobraram."""
+    details_dir = os.path.join(out_dir, "details")
+    os.makedirs(details_dir, exist_ok=True)
+    written = write_if_changed(os.path.join(out_dir, "catalog.json"),
+                               catalog.catalog_bytes(records, [name for name, _ in TRACKS]))
+    details = catalog.detail_files(records)
+    written += sum(write_if_changed(os.path.join(details_dir, f"{cid}.json"), blob) for cid, blob in details.items())
+    for name in os.listdir(details_dir):
+        cid, ext = os.path.splitext(name)
+        if ext == ".json" and cid not in details:
+            os.remove(os.path.join(details_dir, name))
+    return written
+
+
+def print_plan(changes):
+    for key, label in (("added", "Adicionados"), ("changed", "Alterados"), ("removed", "Removidos")):
+        ids = changes[key]
+        print(f"{label}: {len(ids)}")
+        for cid in ids:
+            print(f"  {cid}")
+    print(f"Inalterados: {len(changes['unchanged'])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build incremental dos desafios.")
+    parser.add_argument("--plan", action="store_true", help="apenas mostra o plano, nao grava nada")
+    parser.add_argument("--prune", action="store_true", help="apaga os arquivos de ids removidos")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="processos para renderizar em paralelo (0 = numero de CPUs)")
+    parser.add_argument("--bundle", metavar="PATH",
+                        help="tambem grava todos os desafios num bundle unico (ver bundle.py)")
+    parser.add_argument("--seed", metavar="PATH",
+                        help="tambem gera o banco SQLite de seed (ver seed_db.py)")
+    parser.add_argument("--search", metavar="PATH",
+                        help="tambem gera o indice invertido de busca (ver search_index.py)")
+    parser.add_argument("--facets", metavar="PATH",
+                        help="tambem gera o indice de facetas trilha/dificuldade/tag (ver facet_index.py)")
+    parser.add_argument("--markdown", metavar="PATH",
+                        help="tambem grava as descricoes pre-renderadas em HTML, por hash do texto "
+                             "(ver markdown_render.py; cache em .markdown-cache.json)")
+    parser.add_argument("--zip", metavar="PATH",
+                        help="tambem gera o pacote .zip deterministico (ver package_zip.py)")
+    parser.add_argument("--assets", metavar="DIR", help="pasta incluida como assets/ no .zip")
+    parser.add_argument("--previews", metavar="DIR",
+                        help="grava um documento de preview por desafio de HTML/CSS (ver preview.py)")
+    parser.add_argument("--catalog", metavar="DIR",
+                        help="grava o catalogo leve da lista e um detalhe por desafio (ver catalog.py)")
+    parser.add_argument("--verify", action="store_true",
+                        help="confere as regras HTML/CSS contra as solucoes de referencia (ver rule_verifier.py) "
+                             "o testCode expandido contra a forma compacta do bundle (ver template_verifier.py), "
+                             "os exemplos de regressao do Markdown (ver markdown_render.py) "
+                             "e os contadores trilha x dificuldade do indice de facetas (ver facet_index.py)")
+    args = parser.parse_args(argv)
+
+    rendered, records = generate(args.jobs)
+    changes = plan(rendered, load_state())
+    print_plan(changes)
+    files = pack_files(rendered, changes, args.prune)
+    meta = load_manifest()
+    manifest = render(build_manifest(files, meta))
+    if args.plan:
+        print(f"manifest.json: {'inalterado' if read_bytes(MANIFEST) == manifest else 'alterado'}")
+        return changes
+
+    apply(rendered, changes, prune=args.prune)
+    written = len(changes["added"]) + len(changes["changed"])
+    if write_if_changed(MANIFEST, manifest):
+        print("manifest.json atualizado.")
+    if args.bundle:
+        # No bundle vai a forma compacta, com o prelude de cada template uma vez so
+        packed = [records.get(cid) or json.loads(blob.decode("utf-8")) for cid, blob in files.items()]
+        if write_if_changed(args.bundle, bundle.pack_bundle(packed, templates.preludes(packed))):
+            print(f"Bundle atualizado: {args.bundle}")
+    loaded = [json.loads(blob.decode("utf-8")) for blob in files.values()]
+    if args.seed:
+        if write_if_changed(args.seed, seed_db.seed_bytes(loaded, meta.get("name", "base"))):
+            print(f"Seed atualizado: {args.seed}")
+    if args.search:
+        if write_if_changed(args.search, search_index.index_bytes(loaded)):
+            print(f"Indice de busca atualizado: {args.search}")
+    if args.facets:
+        if write_if_changed(args.facets, facet_index.index_bytes(loaded)):
+            print(f"Indice de facetas atualizado: {args.facets}")
+    if args.markdown:
+        cache = markdown_render.MarkdownCache.load(MARKDOWN_CACHE)
+        sidecar = markdown_render.sidecar_bytes(loaded, cache)
+        cache.prune(data.get("description") or "" for data in loaded)
+        write_if_changed(MARKDOWN_CACHE, cache.to_bytes())
+        if write_if_changed(args.markdown, sidecar):
+            print(f"Descricoes em HTML atualizadas: {args.markdown}")
+        print(f"Markdown: {cache.misses} descricao(oes) renderizada(s), demais vindas do cache.")
+    if args.zip:
+        members = package_zip.pack_members(manifest, files, args.assets)
+        if write_if_changed(args.zip, package_zip.zip_bytes(members)):
+            print(f"Pacote .zip atualizado: {args.zip}")
+    if args.previews:
+        count, misses = write_previews(args.previews, loaded)
+        print(f"Previews: {count} gravado(s), {misses} montado(s) fora do cache.")
+    if args.catalog:
+        count = write_catalog(args.catalog, loaded)
+        print(f"Catalogo: {count} arquivo(s) gravado(s) em {args.catalog}")
+    print(f"\n{written} arquivo(s) gravado(s) de {len(rendered)} desafios gerados.")
+    if args.verify:
+        failed = rule_verifier.print_report(rule_verifier.verify_records(loaded, args.jobs))
+        failed += template_verifier.print_report(*template_verifier.verify_records(list(records.values())))
+        failed += markdown_render.print_examples()
+        failed += facet_index.print_check(loaded)
+        if failed:
+            raise SystemExit(1)
+    return changes
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+Correcao em lote de submissoes de turma, fora do app.
+
+Layout das submissoes: uma pasta por aluno, um arquivo por desafio com o id
+do desafio no nome (a extensao nao importa):
+
+    submissoes/
+      ana/html-ini-001.html
+      ana/css-int-004.css
+      bruno/js-ini-001.js
+      ...
+
+html-rules e css-rules sao avaliados em Python com a mesma semantica do app
+(ver rule_verifier.py). js-tests e csharp-tests precisam de um executor:
+uma funcao executor(desafio, codigo) -> [{"name", "passed", "message"}]
+(o mesmo formato do __runTests() / TestRunner.RunTests()). O executor
+embutido "node" roda o codigo + testCode no Node.js local; outros entram
+como modulo:funcao:
+
+    --executor js-tests=node
+    --executor csharp-tests=meu_runner:rodar
+
+ATENCAO: executores rodam codigo de aluno nesta maquina. O vm do Node nao e
+uma fronteira de seguranca (this.constructor.constructor('return process')()
+escapa dele), entao o executor "node" roda cada submissao num processo
+proprio com o modelo de permissoes do Node (>= 20): sem leitura ou escrita
+de arquivos, sem child_process, worker_threads nem addons, numa pasta
+temporaria vazia, com ambiente minimo, memoria limitada e timeout. A rede
+NAO e bloqueada pelo Node 20/22 e nada disso e um sandbox de verdade:
+corrija codigo nao confiavel dentro de uma VM ou container descartavel.
+Executores modulo:funcao rodam do jeito que forem escritos.
+
+Os resultados saem em CSV ou JSONL (pela extensao de --out) conforme cada
+submissao termina, com flush por linha. Se o arquivo ja existir, as
+submissoes que ja estao nele sao puladas: basta rodar de novo depois de uma
+interrupcao. O pool recebe so caminhos, no maximo alguns por worker de cada
+vez, e cada worker carrega os desafios uma vez.
+
+Uso:
+    python bulk_grader.py submissoes --out notas.csv
+    python bulk_grader.py submissoes --out notas.jsonl --jobs 8 --executor js-tests=node
+    python bulk_grader.py submissoes --out notas.csv --restart   # ignora o que ja foi corrigido
+"""
+import csv
+import functools
+import importlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import rule_verifier
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+FIELDS = ("aluno", "desafio", "status", "aprovadas", "total", "ms", "falhas")
+# Tarefas em voo por worker: limita a memoria sem deixar worker ocioso
+IN_FLIGHT = 4
+NODE_TIMEOUT = 10
+NODE_MEMORY_MB = 256
+
+# Roda codigo do aluno + testCode no mesmo contexto e imprime o resultado de
+# __runTests() (aceita {pass} e {passed}, como o JavaScriptValidator)
+NODE_RUNNER = r"""
+const vm = require('vm');
+const [code, tests, timeout] = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const ctx = vm.createContext({ console: { log: () => {} } });
+const out = (v) => process.stdout.write(JSON.stringify(v));
+try { vm.runInContext(code, ctx, { timeout }); }
+catch (e) { out([{ name: 'Execução do código', passed: false, message: 'Erro: ' + e.message }]); process.exit(0); }
+try {
+  vm.runInContext(tests, ctx, { timeout });
+  const r = vm.runInContext('__runTests()', ctx, { timeout });
+  out((Array.isArray(r) ? r : []).map((t, i) => ({
+    name: t.name === undefined ? 'Teste ' + (i + 1) : String(t.name),
+    passed: Boolean(t.pass !== undefined ? t.pass : t.passed),
+    message: t.message === undefined ? '' : String(t.message),
+  })));
+} catch (e) { out([{ name: 'Testes', passed: false, message: 'Erro nos testes: ' + e.message }]); }
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def node_command():
+    """node + flags do modelo de permissoes (--permission a partir do 22.13/23.5)."""
+    node = shutil.which("node")
+    if node is None:
+        raise RuntimeError("node nao encontrado no PATH")
+    version = subprocess.run([node, "--version"], capture_output=True, text=True, timeout=NODE_TIMEOUT).stdout
+    major, minor = (int(part) for part in version.strip().lstrip("v").split(".")[:2])
+    if major < 20:
+        raise RuntimeError(f"node {version.strip()} nao tem modelo de permissoes; use Node.js >= 20")
+    flag = "--permission" if (major, minor) >= (23, 5) or (major == 22 and minor >= 13) else "--experimental-permission"
+    # Sem nenhum --allow-*: nada de fs, child_process, worker_threads nem addons
+    return [node, flag, "--no-warnings", f"--max-old-space-size={NODE_MEMORY_MB}"]
+
+
+def node_executor(challenge, code):
+    """
+    Executor de js-tests no Node.js local (mesmo timeout do app, 10 s), um
+    processo por submissao, sem permissoes (ver a docstring do modulo).
+    """
+    command = node_command()
+    test_code = (challenge.get("validatorConfig") or {}).get("testCode") or ""
+    payload = json.dumps([code, test_code, NODE_TIMEOUT * 1000])
+    # So o minimo para o node subir no Windows; nada de NODE_OPTIONS, tokens etc.
+    env = {k: os.environ[k] for k in ("SYSTEMROOT",) if k in os.environ}
+    with tempfile.TemporaryDirectory(prefix="codegym-node-") as cwd:
+        proc = subprocess.run(command + ["-e", NODE_RUNNER], input=payload, capture_output=True, cwd=cwd, env=env,
+                              text=True, encoding="utf-8", timeout=NODE_TIMEOUT + 5)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"node saiu com {proc.returncode}")
+    return json.loads(proc.stdout)
+
+
+BUILTIN_EXECUTORS = {"node": node_executor}
+
+
+def load_executor(spec):
+    """'node' ou 'modulo:funcao' (funcao padrao: run)."""
+    if spec in BUILTIN_EXECUTORS:
+        return BUILTIN_EXECUTORS[spec]
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name or "run")
+
+
+def parse_executor(text):
+    """'js-tests=node' -> ('js-tests', 'node')."""
+    kind, sep, spec = text.partition("=")
+    if not sep or not spec:
+        raise ValueError(f"Executor invalido: '{text}' (use TIPO=executor)")
+    return kind, spec
+
+
+def rule_results(challenge, code):
+    """Resultados das regras HTML/CSS no formato dos executores."""
+    rules = challenge["validatorConfig"]["rules"]
+    results = []
+    for n, passed, error in rule_verifier.evaluate(challenge, code):
+        rule = rules[n - 1]
+        message = rule.get("successMessage", "") if passed else (
+            f"Erro ao avaliar regra: {error}" if error is not None else rule.get("errorMessage", ""))
+        name = " ".join(filter(None, (rule.get("type"), rule.get("selector"))))
+        results.append({"name": name, "passed": passed, "message": message})
+    return results
+
+
+# ===================== WORKER =====================
+
+_challenges = {}
+_executors = {}
+
+
+def _init(challenge_paths, executor_specs):
+    _challenges.clear()
+    _challenges.update((d["id"], d) for d in rule_verifier.load_records(challenge_paths))
+    _executors.clear()
+    _executors.update((kind, load_executor(spec)) for kind, spec in executor_specs.items())
+
+
+def check(cid, code):
+    """
+    Avalia um codigo contra o desafio cid (worker ja iniciado com _init).
+    Sempre devolve {"status", "aprovadas", "total", "detalhes"}: erros viram status.
+    """
+    result = {"status": "erro", "aprovadas": 0, "total": 0, "detalhes": []}
+    challenge = _challenges.get(cid)
+    if challenge is None:
+        result["status"] = "desafio-desconhecido"
+        return result
+    kind = challenge.get("validatorType")
+    try:
+        if kind in rule_verifier.VALIDATORS:
+            results = rule_results(challenge, code)
+        elif kind in _executors:
+            results = list(_executors[kind](challenge, code))
+        else:
+            result["status"] = "sem-executor"
+            return result
+    except Exception as ex:
+        result["detalhes"] = [{"nome": "Execução", "passou": False, "mensagem": f"{type(ex).__name__}: {ex}"}]
+        return result
+    result["detalhes"] = [{"nome": r.get("name", ""), "passou": bool(r.get("passed")), "mensagem": r.get("message", "")}
+                          for r in results]
+    result["total"] = len(results)
+    result["aprovadas"] = sum(r["passou"] for r in result["detalhes"])
+    result["status"] = "passou" if results and result["aprovadas"] == result["total"] else "falhou"
+    return result
+
+
+def grade(student, cid, path):
+    """Corrige uma submissao: linha de resultado com aluno, desafio e tempo."""
+    start = time.perf_counter()
+    if cid not in _challenges:
+        result = check(cid, "")
+    else:
+        try:
+            with open(path, "r", encoding="utf-8-sig") as f:
+                result = check(cid, f.read())
+        except (OSError, UnicodeDecodeError) as ex:
+            result = {"status": "erro", "aprovadas": 0, "total": 0,
+                      "detalhes": [{"nome": "Leitura", "passou": False, "mensagem": f"{type(ex).__name__}: {ex}"}]}
+    return {"aluno": student, "desafio": cid, "status": result["status"], "aprovadas": result["aprovadas"],
+            "total": result["total"], "ms": round((time.perf_counter() - start) * 1000, 1),
+            "detalhes": result["detalhes"]}
+
+
+# ===================== SUBMISSOES E SAIDA =====================
+
+def submissions(folder):
+    """(aluno, id do desafio, caminho) de cada arquivo, em ordem, sem ler o conteudo."""
+    for student in sorted(os.listdir(folder)):
+        sdir = os.path.join(folder, student)
+        if not os.path.isdir(sdir) or student.startswith("."):
+            continue
+        for name in sorted(os.listdir(sdir)):
+            path = os.path.join(sdir, name)
+            if os.path.isfile(path) and not name.startswith("."):
+                yield student, os.path.splitext(name)[0], path
+
+
+class ResultWriter:
+    """Saida em streaming (CSV ou JSONL), retomavel: done guarda (aluno, desafio) ja gravados."""
+
+    def __init__(self, path, restart=False):
+        self.path = path
+        self.jsonl = path.lower().endswith((".jsonl", ".ndjson"))
+        self.done = set()
+        if restart or not os.path.exists(path):
+            self.file = open(path, "w", encoding="utf-8", newline="")
+            fresh = True
+        else:
+            self._recover()
+            self.file = open(path, "a", encoding="utf-8", newline="")
+            fresh = os.path.getsize(path) == 0
+        self.csv = None if self.jsonl else csv.DictWriter(self.file, FIELDS)
+        if self.csv is not None and fresh:
+            self.csv.writeheader()
+            self.file.flush()
+
+    def _recover(self):
+        # Linha cortada por uma interrupcao: descarta e corrige de novo
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+        with open(self.path, "r", encoding="utf-8", newline="") as f:
+            if self.jsonl:
+                rows = (json.loads(line) for line in f if line.strip())
+            else:
+                rows = csv.DictReader(f)
+            self.done.update((row["aluno"], row["desafio"]) for row in rows)
+
+    def write(self, row):
+        if self.jsonl:
+            self.file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        else:
+            failures = " | ".join(f"{d['nome']}: {d['mensagem']}" for d in row["detalhes"] if not d["passou"])
+            self.csv.writerow({**{k: row[k] for k in FIELDS if k != "falhas"},
+                               "falhas": " ".join(failures.split())})
+        self.file.flush()
+        self.done.add((row["aluno"], row["desafio"]))
+
+    def close(self):
+        self.file.close()
+
+
+def run(folder, writer, challenge_paths, executor_specs, jobs=0):
+    """Corrige o que ainda nao esta no writer. Retorna {status: quantidade}."""
+    pending = ((s, c, p) for s, c, p in submissions(folder) if (s, c) not in writer.done)
+    counts = {}
+
+    def record(row):
+        writer.write(row)
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+
+    workers = jobs or os.cpu_count() or 1
+    if workers == 1:
+        _init(challenge_paths, executor_specs)
+        for task in pending:
+            record(grade(*task))
+        return counts
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init,
+                             initargs=(challenge_paths, executor_specs)) as pool:
+        running = set()
+        for task in pending:
+            running.add(pool.submit(grade, *task))
+            if len(running) >= workers * IN_FLIGHT:
+                finished, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    record(future.result())
+        for future in running:
+            record(future.result())
+    return counts
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Correcao em lote de submissoes (uma pasta por aluno).")
+    parser.add_argument("submissions", help="pasta com uma subpasta por aluno")
+    parser.add_argument("--out", required=True, help="arquivo de resultados (.csv ou .jsonl)")
+    parser.add_argument("--challenges", action="append", metavar="PATH",
+                        help="arquivos ou pastas de desafios (padrao: challenges/; pode repetir)")
+    parser.add_argument("--executor", action="append", type=parse_executor, default=[], metavar="TIPO=EXECUTOR",
+                        help="executor de js-tests/csharp-tests: 'node' ou modulo:funcao (pode repetir). "
+                             "Executores rodam codigo de aluno; 'node' limita arquivos e processos, "
+                             "mas nao e um sandbox: use uma VM ou container para codigo nao confiavel")
+    parser.add_argument("--jobs", type=int, default=0, help="processos (0 = numero de CPUs, padrao)")
+    parser.add_argument("--restart", action="store_true", help="recomeca do zero em vez de retomar --out")
+    args = parser.parse_args(argv)
+
+    challenge_paths = args.challenges or [os.path.join(ROOT, "challenges")]
+    executors = dict(args.executor)
+    for spec in executors.values():
+        load_executor(spec)  # falha aqui, e nao em cada worker
+
+    writer = ResultWriter(args.out, args.restart)
+    if writer.done:
+        print(f"Retomando: {len(writer.done)} submissao(oes) ja corrigida(s) em {args.out}")
+    start = time.perf_counter()
+    try:
+        counts = run(args.submissions, writer, challenge_paths, executors, args.jobs)
+    finally:
+        writer.close()
+    total = sum(counts.values())
+    summary = ", ".join(f"{status}: {n}" for status, n in sorted(counts.items())) or "nada novo"
+    print(f"{total} submissao(oes) corrigida(s) em {time.perf_counter() - start:.1f}s ({summary}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
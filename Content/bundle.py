@@ -0,0 +1,141 @@
+"""
+Bundle de desafios em arquivo unico, com indice de offsets para leitura lazy.
+
+Formato (todos os inteiros little-endian):
+
+    MAGIC        8 bytes   b"CGBUNDL1"
+    header_len   uint32    tamanho do header em bytes
+    header       JSON      {"version": 1, "entries": [[id, offset, length, track, difficulty], ...],
+                            "templates": {nome: prelude}}
+    dados        ...       registros JSON compactos (UTF-8), um apos o outro
+
+Os offsets do indice sao relativos ao inicio da area de dados. Um consumidor
+le so o header e depois busca um desafio direto pelo offset, sem parsear os
+demais. O Bundle abaixo faz isso via mmap.
+
+Desafios de JS e C# sao guardados na forma compacta (referencia ao template
++ payload dos testes, ver templates.py); o prelude de cada template fica uma
+vez so no header, em "templates".
+
+Uso:
+    with Bundle("challenges.bundle") as b:
+        data = b.get("js-ini-001")
+        ids = b.ids(track="css", difficulty="Avancado")
+"""
+import json
+import mmap
+import struct
+
+import templates
+
+MAGIC = b"CGBUNDL1"
+VERSION = 1
+_LEN = struct.Struct("<I")
+
+
+def encode_record(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def pack_bundle(records, preludes=None):
+    """Serializa os registros (dicts) em bytes de bundle, ordenados por id."""
+    records = sorted(records, key=lambda data: data["id"])
+    entries = []
+    blobs = []
+    offset = 0
+    for data in records:
+        blob = encode_record(data)
+        entries.append([data["id"], offset, len(blob), data.get("track", ""), data.get("difficulty", "")])
+        blobs.append(blob)
+        offset += len(blob)
+    header = json.dumps({"version": VERSION, "entries": entries, "templates": preludes or {}},
+                        ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return b"".join([MAGIC, _LEN.pack(len(header)), header] + blobs)
+
+
+def write_bundle(path, records, preludes=None):
+    with open(path, "wb") as f:
+        f.write(pack_bundle(records, preludes))
+
+
+class BundleEntry:
+    __slots__ = ("id", "offset", "length", "track", "difficulty")
+
+    def __init__(self, id, offset, length, track, difficulty):
+        self.id = id
+        self.offset = offset
+        self.length = length
+        self.track = track
+        self.difficulty = difficulty
+
+    def __repr__(self):
+        return f"BundleEntry({self.id!r}, offset={self.offset}, length={self.length})"
+
+
+class Bundle:
+    """Leitor de bundle mapeado em memoria. So o header e parseado ao abrir."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap nao aceita arquivo vazio
+            self._file.close()
+            raise ValueError(f"Bundle invalido (vazio): {path}")
+
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Bundle invalido (assinatura): {path}")
+        start = len(MAGIC)
+        (header_len,) = _LEN.unpack_from(self._map, start)
+        start += _LEN.size
+        header = json.loads(self._map[start:start + header_len].decode("utf-8"))
+        if header.get("version") != VERSION:
+            self.close()
+            raise ValueError(f"Versao de bundle nao suportada: {header.get('version')}")
+
+        self._data_start = start + header_len
+        self._entries = {row[0]: BundleEntry(*row) for row in header["entries"]}
+        self.templates = header.get("templates", {})
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, cid):
+        return cid in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def entry(self, cid):
+        return self._entries[cid]
+
+    def ids(self, track=None, difficulty=None):
+        """Ids do bundle (em ordem), opcionalmente filtrados so pelo indice."""
+        return [e.id for e in self._entries.values()
+                if (track is None or e.track == track)
+                and (difficulty is None or e.difficulty == difficulty)]
+
+    def raw(self, cid):
+        """Bytes JSON de um desafio, sem decodificar."""
+        e = self._entries[cid]
+        start = self._data_start + e.offset
+        return self._map[start:start + e.length]
+
+    def get(self, cid, expand=False):
+        """Registro de um desafio. Com expand=True devolve o testCode autocontido."""
+        data = json.loads(self.raw(cid).decode("utf-8"))
+        return templates.expand(data) if expand else data
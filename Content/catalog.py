@@ -0,0 +1,107 @@
+"""
+Catalogo leve dos desafios (campos da lista) + detalhes por desafio.
+
+A tela de lista so precisa de id, titulo, tags e dificuldade; o resto
+(descricao, starterCode, validatorConfig com os testes completos) so e lido
+quando o desafio e aberto. O build separa as duas partes:
+
+    catalog.json          todos os desafios, agrupados por trilha
+    details/{id}.json     o resto de cada registro
+
+Formato do catalog.json:
+
+    {
+      "version": 1,
+      "count": 320,
+      "tracks": {
+        "html": [{"id": "html-ini-001", "title": ..., "tags": [...], "difficulty": "Iniciante"}, ...],
+        ...
+      }
+    }
+
+Trilhas na ordem recebida (a do build); dentro de cada trilha, por
+dificuldade (Iniciante, Intermediario, Avancado, ja normalizada como no
+indice de facetas) e depois por id. A trilha
+fica implicita no grupo. O detalhe guarda o id e todos os outros campos do
+registro, na forma que o app le (testCode expandido).
+"""
+import json
+import os
+
+import facet_index
+
+VERSION = 1
+CATALOG_FIELDS = ("id", "title", "tags", "difficulty")
+
+
+def _compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def split_record(data):
+    """(entrada do catalogo, detalhe) de um registro."""
+    entry = {field: data[field] for field in CATALOG_FIELDS if field in data}
+    detail = {"id": data["id"]}
+    detail.update((k, v) for k, v in data.items() if k not in CATALOG_FIELDS and k != "track")
+    return entry, detail
+
+
+def _sort_key(data):
+    return facet_index.DIFFICULTIES.index(facet_index.difficulty(data)), data["id"]
+
+
+def build_catalog(records, track_order=()):
+    """Monta o catalogo. Trilhas fora de track_order vem depois, em ordem alfabetica."""
+    groups = {}
+    for data in sorted(records, key=_sort_key):
+        groups.setdefault(data["track"], []).append(split_record(data)[0])
+    order = [t for t in track_order if t in groups] + sorted(t for t in groups if t not in track_order)
+    return {
+        "version": VERSION,
+        "count": sum(len(entries) for entries in groups.values()),
+        "tracks": {track: groups[track] for track in order},
+    }
+
+
+def catalog_bytes(records, track_order=()):
+    return _compact(build_catalog(records, track_order))
+
+
+def detail_files(records):
+    """{id: bytes do detalhe} de cada registro."""
+    return {data["id"]: _compact(split_record(data)[1]) for data in records}
+
+
+class Catalog:
+    """Leitura do catalogo; os detalhes sao lidos do disco so quando pedidos."""
+
+    def __init__(self, folder, catalog):
+        if catalog.get("version") != VERSION:
+            raise ValueError(f"Versao de catalogo nao suportada: {catalog.get('version')}")
+        self.folder = folder
+        self.tracks = catalog["tracks"]
+        self._details = {}
+
+    @classmethod
+    def load(cls, folder):
+        with open(os.path.join(folder, "catalog.json"), "r", encoding="utf-8") as f:
+            return cls(folder, json.load(f))
+
+    def entries(self, track, difficulty=None):
+        """Entradas de uma trilha (opcionalmente so de uma dificuldade canonica), na ordem da lista."""
+        return [e for e in self.tracks.get(track, []) if difficulty in (None, facet_index.difficulty(e))]
+
+    def detail(self, cid):
+        """Detalhe de um desafio, lido de details/{id}.json na primeira vez."""
+        if cid not in self._details:
+            with open(os.path.join(self.folder, "details", f"{cid}.json"), "r", encoding="utf-8") as f:
+                self._details[cid] = json.load(f)
+        return self._details[cid]
+
+    def record(self, cid):
+        """Registro completo (catalogo + detalhe), como no arquivo do desafio."""
+        for track, entries in self.tracks.items():
+            for entry in entries:
+                if entry["id"] == cid:
+                    return {**entry, "track": track, **self.detail(cid)}
+        raise KeyError(cid)
@@ -0,0 +1,184 @@
+"""
+Indice de facetas em bitmaps: trilha, dificuldade e tag.
+
+Cada desafio recebe um ordinal denso (ordem de id, a mesma do indice de
+busca) e cada valor de faceta vira um bitmap com um bit por ordinal. Filtros
+combinados viram AND/OR de inteiros em vez de varrer os registros.
+
+Formato (JSON):
+
+    {
+      "version": 1,
+      "ids": ["css-adv-001", ...],                  # ordinal -> id
+      "facets": {
+        "track": {"html": "<base64>", ...},
+        "difficulty": {"Iniciante": "<base64>", ...},
+        "tag": {"flexbox": "<base64>", ...}
+      }
+    }
+
+Cada bitmap e o inteiro em little-endian (bit i = ordinal i), em base64,
+sempre com ceil(len(ids) / 8) bytes.
+
+A dificuldade entra ja canonica (Iniciante/Intermediario/Avancado), com o
+mesmo criterio do Challenge.Difficulty do app: "intermediario" e
+"Intermediário" caem no mesmo bitmap e valor desconhecido vira Iniciante.
+"""
+import base64
+import json
+
+VERSION = 1
+FACETS = ("track", "difficulty", "tag")
+DIFFICULTIES = ("Iniciante", "Intermediario", "Avancado")
+
+# Mesmo switch do Challenge.Difficulty (src/CodeGym.Core/Models/Challenge.cs)
+_DIFFICULTY_ALIASES = {
+    "iniciante": "Iniciante",
+    "intermediario": "Intermediario",
+    "intermediário": "Intermediario",
+    "avancado": "Avancado",
+    "avançado": "Avancado",
+}
+
+
+def difficulty(data):
+    """Dificuldade canonica do registro, como o app le: sem caixa e acento, desconhecida = Iniciante."""
+    return _DIFFICULTY_ALIASES.get((data.get("difficulty") or "").lower(), "Iniciante")
+
+
+def _values(data, facet):
+    if facet == "tag":
+        return data.get("tags", [])
+    if facet == "difficulty":
+        return [difficulty(data)]
+    value = data.get(facet)
+    return [value] if value else []
+
+
+def _encode(bitmap, nbytes):
+    return base64.b64encode(bitmap.to_bytes(nbytes, "little")).decode("ascii")
+
+
+def _decode(text):
+    return int.from_bytes(base64.b64decode(text), "little")
+
+
+def build_index(records):
+    """Monta o indice a partir dos registros. Saida deterministica (ordem de id)."""
+    records = sorted(records, key=lambda data: data["id"])
+    nbytes = (len(records) + 7) // 8
+    facets = {facet: {} for facet in FACETS}
+    for ordinal, data in enumerate(records):
+        bit = 1 << ordinal
+        for facet in FACETS:
+            for value in _values(data, facet):
+                facets[facet][value] = facets[facet].get(value, 0) | bit
+    return {
+        "version": VERSION,
+        "ids": [data["id"] for data in records],
+        "facets": {facet: {value: _encode(bitmap, nbytes) for value, bitmap in sorted(values.items())}
+                   for facet, values in facets.items()},
+    }
+
+
+def index_bytes(records):
+    return json.dumps(build_index(records), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def popcount(bitmap):
+    return bin(bitmap).count("1")
+
+
+class FacetIndex:
+    """
+    Consulta ao indice. Bitmaps sao inteiros Python: & intersecta, | une.
+
+        idx = FacetIndex.load("facets.json")
+        hits = idx.query(track="css", difficulty=["Iniciante", "Intermediario"], tags=["flexbox"])
+        idx.ids(hits), idx.count(hits)
+    """
+
+    def __init__(self, index):
+        if index.get("version") != VERSION:
+            raise ValueError(f"Versao de indice de facetas nao suportada: {index.get('version')}")
+        self.id_list = index["ids"]
+        self.facets = {facet: {value: _decode(text) for value, text in values.items()}
+                       for facet, values in index["facets"].items()}
+        self.everything = (1 << len(self.id_list)) - 1
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def bitmap(self, facet, value):
+        """Bitmap de um valor; valor desconhecido casa com nada."""
+        return self.facets.get(facet, {}).get(value, 0)
+
+    def any_of(self, facet, values):
+        """Uniao dos bitmaps dos valores (OR)."""
+        result = 0
+        for value in values:
+            result |= self.bitmap(facet, value)
+        return result
+
+    def all_of(self, facet, values):
+        """Intersecao dos bitmaps dos valores (AND)."""
+        result = self.everything
+        for value in values:
+            result &= self.bitmap(facet, value)
+        return result
+
+    def query(self, track=None, difficulty=None, tags=None, any_tag=False):
+        """
+        AND entre facetas. track e difficulty aceitam um valor ou uma lista
+        (OR dentro da faceta); tags exige todas, ou qualquer uma com any_tag.
+        None deixa a faceta sem filtro.
+        """
+        result = self.everything
+        for facet, value in (("track", track), ("difficulty", difficulty)):
+            if value is not None:
+                result &= self.any_of(facet, [value] if isinstance(value, str) else value)
+        if tags:
+            result &= self.any_of("tag", tags) if any_tag else self.all_of("tag", tags)
+        return result
+
+    def ids(self, bitmap):
+        """Ids dos bits ligados, em ordem de ordinal."""
+        out = []
+        while bitmap:
+            low = bitmap & -bitmap
+            out.append(self.id_list[low.bit_length() - 1])
+            bitmap ^= low
+        return out
+
+    def count(self, bitmap):
+        return popcount(bitmap)
+
+    def counts(self, facet, within=None):
+        """{valor: quantos desafios} da faceta, opcionalmente dentro de um bitmap (contadores da UI)."""
+        within = self.everything if within is None else within
+        return {value: popcount(bitmap & within) for value, bitmap in self.facets.get(facet, {}).items()}
+
+
+def check_counts(records):
+    """
+    Confere os contadores do indice: em cada trilha a soma dos desafios por
+    dificuldade tem que dar o total da trilha. Retorna as trilhas que nao batem.
+    """
+    index = FacetIndex(build_index(records))
+    problems = []
+    for track, bitmap in sorted(index.facets["track"].items()):
+        by_difficulty = {value: n for value, n in index.counts("difficulty", within=bitmap).items() if n}
+        if sum(by_difficulty.values()) != index.count(bitmap) or set(by_difficulty) - set(DIFFICULTIES):
+            problems.append(f"{track}: {index.count(bitmap)} desafio(s), por dificuldade {by_difficulty}")
+    return problems
+
+
+def print_check(records):
+    """Imprime as trilhas com contadores divergentes e o resumo. Retorna o numero de trilhas com problema."""
+    problems = check_counts(records)
+    for message in problems:
+        print(f"  {message}")
+    print(f"Facetas: {len(records)} desafio(s), {len(problems)} trilha(s) com contadores divergentes.")
+    return len(problems)
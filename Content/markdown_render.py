@@ -0,0 +1,298 @@
+"""
+Renderizacao de Markdown das descricoes em tempo de build.
+
+Cobre o subconjunto usado nos enunciados: paragrafos separados por linha em
+branco, quebras de linha simples, `codigo`, **negrito**, *italico*, listas
+("- item" e "1. item") e titulos (#, ##, ###). Enfase e listas seguem as
+regras do CommonMark (delimitadores left/right-flanking; item de lista
+interrompe paragrafo). Todo o texto e escapado antes da formatacao, entao
+nenhum HTML do enunciado passa para a saida.
+
+EXAMPLES guarda casos que ja quebraram; `python markdown_render.py` (e
+build.py --verify) confere todos.
+
+O MarkdownCache guarda o HTML por SHA-256 do texto-fonte (e descarta tudo
+quando RENDERER_VERSION muda): descricoes que nao mudaram nunca sao
+renderizadas de novo. O resultado sai num arquivo a parte
+(build_sidecar), indexado pelo mesmo hash; os JSON dos desafios nao mudam.
+"""
+import hashlib
+import html
+import json
+import re
+import unicodedata
+
+_CODE = re.compile(r"`([^`]+)`")
+_STARS = re.compile(r"\*+")
+_BULLET = re.compile(r"^[-*] (.*)$")
+_NUMBERED = re.compile(r"^(\d{1,9})[.)] (.*)$")
+_HEADING = re.compile(r"^(#{1,3}) (.*)$")
+_SLOT = "\0"  # marca o lugar de um trecho de codigo enquanto a enfase e resolvida
+SIDECAR_VERSION = 1
+# Incrementar quando a saida de render_markdown mudar: o cache de outra versao e descartado
+RENDERER_VERSION = 2
+
+
+def _kind(char):
+    """'s' (espaco ou borda), 'p' (pontuacao/simbolo; codigo conta como `) ou 'w'."""
+    if not char or char.isspace():
+        return "s"
+    if char == _SLOT or unicodedata.category(char)[0] in "PS":
+        return "p"
+    return "w"
+
+
+def _emphasis(text):
+    """
+    *italico* e **negrito** pelas regras de delimitadores do CommonMark: uma
+    sequencia de * so abre se for left-flanking e so fecha se for
+    right-flanking, e a regra do multiplo de 3 vale. Sequencias soltas (ex.:
+    "por ***.") ficam como texto.
+    """
+    pieces = []
+    delims = []
+    pos = 0
+    for m in _STARS.finditer(text):
+        pieces.append(text[pos:m.start()])
+        before = _kind(text[m.start() - 1] if m.start() else "")
+        after = _kind(text[m.end()] if m.end() < len(text) else "")
+        left = after != "s" and (after != "p" or before in "sp")
+        right = before != "s" and (before != "p" or after in "sp")
+        delim = {"piece": len(pieces), "size": len(m.group()), "count": len(m.group()),
+                 "open": left, "close": right, "tags_open": [], "tags_close": []}
+        pieces.append(delim)
+        delims.append(delim)
+        pos = m.end()
+    pieces.append(text[pos:])
+
+    i = 0
+    while i < len(delims):
+        closer = delims[i]
+        if not closer["close"]:
+            i += 1
+            continue
+        j = i - 1
+        while j >= 0:
+            opener = delims[j]
+            odd = (opener["close"] or closer["open"]) and (opener["size"] + closer["size"]) % 3 == 0 \
+                and not (opener["size"] % 3 == 0 and closer["size"] % 3 == 0)
+            if opener["open"] and not odd:
+                break
+            j -= 1
+        if j < 0:
+            i += 1
+            continue
+        use = 2 if opener["count"] >= 2 and closer["count"] >= 2 else 1
+        tag = "strong" if use == 2 else "em"
+        opener["count"] -= use
+        closer["count"] -= use
+        opener["tags_open"].append(f"<{tag}>")
+        closer["tags_close"].append(f"</{tag}>")
+        del delims[j + 1:i]  # o que ficou entre os dois vira texto
+        i = j + 1
+        if opener["count"] == 0:
+            del delims[j]
+            i -= 1
+        if closer["count"] == 0:
+            del delims[i]
+
+    out = []
+    for piece in pieces:
+        if isinstance(piece, str):
+            out.append(piece)
+        else:
+            # A enfase consome os * de dentro: quem fecha usa os da esquerda, quem abre os da direita
+            out.append("".join(piece["tags_close"]) + "*" * piece["count"] + "".join(reversed(piece["tags_open"])))
+    return "".join(out)
+
+
+def _inline(text):
+    # Codigo vira marcador antes da enfase, para que * e ** dentro de `...` nao
+    # virem formatacao e ** em volta de `...` ainda feche
+    code = []
+
+    def slot(m):
+        code.append(f"<code>{m.group(1)}</code>")
+        return _SLOT
+
+    text = _emphasis(_CODE.sub(slot, html.escape(text, quote=False)))
+    chunks = text.split(_SLOT)
+    return "".join(chunk + (code[n] if n < len(code) else "") for n, chunk in enumerate(chunks))
+
+
+def _lines(lines):
+    return _inline("\n".join(lines)).replace("\n", "<br>")
+
+
+def _blocks(text):
+    """
+    [[tipo, conteudo, inicio]]: "h" (linha do titulo), "p" (linhas) ou "ul"/"ol"
+    (itens, cada um com suas linhas). Como no CommonMark, um item de lista
+    interrompe o paragrafo de cima (numerado so se comecar em 1), e uma linha
+    comum logo apos um item continua esse item.
+    """
+    blocks = []
+    current = None
+    gap = False  # linha em branco depois de um item: outro item do mesmo tipo continua a lista
+    for line in text.replace("\r\n", "\n").split("\n"):
+        line = line.strip()
+        if not line:
+            gap = current is not None and current[0] in ("ul", "ol")
+            if not gap:
+                current = None
+            continue
+        heading = _HEADING.match(line)
+        bullet = _BULLET.match(line)
+        numbered = _NUMBERED.match(line)
+        if heading:
+            blocks.append(["h", heading, None])
+            current = None
+        elif bullet or numbered:
+            kind, item = ("ul", bullet.group(1)) if bullet else ("ol", numbered.group(2))
+            if current is not None and current[0] == kind:
+                current[1].append([item])
+            elif current is not None and current[0] == "p" and not gap and kind == "ol" and numbered.group(1) != "1":
+                current[1].append(line)
+            else:
+                current = [kind, [[item]], int(numbered.group(1)) if numbered else None]
+                blocks.append(current)
+        elif current is not None and current[0] in ("ul", "ol") and not gap:
+            current[1][-1].append(line)
+        elif current is not None and current[0] == "p":
+            current[1].append(line)
+        else:
+            current = ["p", [line], None]
+            blocks.append(current)
+        gap = False
+    return blocks
+
+
+def _block(kind, content, start):
+    if kind == "h":
+        level = len(content.group(1)) + 2  # h3..h5: o titulo do desafio ja ocupa os niveis de cima
+        return f"<h{level}>{_inline(content.group(2))}</h{level}>"
+    if kind in ("ul", "ol"):
+        body = "".join(f"<li>{_lines(item)}</li>" for item in content)
+        attrs = f' start="{start}"' if kind == "ol" and start != 1 else ""
+        return f"<{kind}{attrs}>{body}</{kind}>"
+    return f"<p>{_lines(content)}</p>"
+
+
+def render_markdown(text):
+    """Converte o Markdown de uma descricao em HTML sanitizado."""
+    return "".join(_block(*block) for block in _blocks(text))
+
+
+# Casos que ja quebraram: (Markdown, HTML esperado). Conferidos por check_examples().
+EXAMPLES = [
+    # js-int-025: "***" solto e texto, nao enfase
+    ("Crie `censurar(str)` substitui palavrões por ***.",
+     "<p>Crie <code>censurar(str)</code> substitui palavrões por ***.</p>"),
+    # csharp-int-030: lista numerada logo apos o paragrafo
+    ("Requisitos:\n1. Se for `int`\n2. Se for `string`",
+     "<p>Requisitos:</p><ol><li>Se for <code>int</code></li><li>Se for <code>string</code></li></ol>"),
+    ("Use **`x`** e *`y`*", "<p>Use <strong><code>x</code></strong> e <em><code>y</code></em></p>"),
+    ("***tudo*** e **meio *dentro* meio**",
+     "<p><em><strong>tudo</strong></em> e <strong>meio <em>dentro</em> meio</strong></p>"),
+    ("2 * 3 * 4 e a*b*c", "<p>2 * 3 * 4 e a<em>b</em>c</p>"),
+    ("*a** e **b*", "<p><em>a</em>* e *<em>b</em></p>"),
+    ("Antes:\n2. nao e lista", "<p>Antes:<br>2. nao e lista</p>"),
+    ("- a\ncontinua\n\n- b\n\nfim", "<ul><li>a<br>continua</li><li>b</li></ul><p>fim</p>"),
+    ("## Titulo\ntexto <b>", "<h4>Titulo</h4><p>texto &lt;b&gt;</p>"),
+]
+
+
+def check_examples():
+    """[(Markdown, esperado, obtido)] dos EXAMPLES que nao batem."""
+    failures = []
+    for source, expected in EXAMPLES:
+        got = render_markdown(source)
+        if got != expected:
+            failures.append((source, expected, got))
+    return failures
+
+
+def print_examples():
+    """Imprime os EXAMPLES que nao batem e o resumo. Retorna quantos falharam."""
+    failures = check_examples()
+    for source, expected, got in failures:
+        print(f"Markdown {source!r}\n  esperado: {expected}\n  obtido:   {got}")
+    print(f"Markdown: {len(EXAMPLES)} exemplo(s) de regressao, {len(failures)} com problema.")
+    return len(failures)
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class MarkdownCache:
+    """
+    Cache {sha256 do texto: html} persistido em JSON, com a RENDERER_VERSION
+    que gerou o HTML no cabecalho: {"version", "entries"}. Arquivo de outra
+    versao (ou do formato antigo, sem cabecalho) e ignorado por inteiro.
+    """
+
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls()
+        if data.get("version") != RENDERER_VERSION:
+            return cls()
+        return cls(data.get("entries"))
+
+    def render(self, text):
+        key = text_hash(text)
+        cached = self.entries.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        rendered = render_markdown(text)
+        self.entries[key] = rendered
+        return rendered
+
+    def prune(self, texts):
+        """Descarta entradas de descricoes que nao existem mais."""
+        keep = {text_hash(text) for text in texts}
+        self.entries = {k: v for k, v in self.entries.items() if k in keep}
+
+    def to_bytes(self):
+        data = {"version": RENDERER_VERSION, "entries": dict(sorted(self.entries.items()))}
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def build_sidecar(records, cache):
+    """
+    HTML das descricoes, fora dos desafios (que ficam intactos):
+
+        {"version": 1, "challenges": {id: sha256 da description}, "html": {sha256: html}}
+
+    O app acha o HTML de um enunciado pelo hash do texto que ja tem; quando
+    o texto muda, o hash nao casa mais e ele volta a mostrar a description.
+    Descricoes iguais guardam o HTML uma vez so.
+    """
+    challenges = {}
+    rendered = {}
+    for data in sorted(records, key=lambda d: d["id"]):
+        text = data.get("description") or ""
+        key = text_hash(text)
+        challenges[data["id"]] = key
+        if key not in rendered:
+            rendered[key] = cache.render(text)
+    return {"version": SIDECAR_VERSION, "challenges": challenges, "html": dict(sorted(rendered.items()))}
+
+
+def sidecar_bytes(records, cache):
+    return json.dumps(build_sidecar(records, cache), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+if __name__ == "__main__":
+    raise SystemExit(1 if print_examples() else 0)
@@ -0,0 +1,89 @@
+"""
+Gerador deterministico do pacote .zip importavel (ver docs/FORMATO_PACOTES.md).
+
+Os registros vao direto da memoria para o zip, sem gravar arquivos soltos
+antes. A compressao (deflate) de cada membro roda num pool de threads (zlib
+libera o GIL) e o zip e montado na mao com struct, na ordem dos nomes.
+
+Para a mesma entrada o arquivo sai identico byte a byte: entradas ordenadas,
+data fixa (1980-01-01 00:00), permissoes fixas (0644), sem campos extras e
+sem comentario.
+"""
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+COMPRESS_LEVEL = 9
+DOS_TIME = 0
+DOS_DATE = (0 << 9) | (1 << 5) | 1  # 1980-01-01
+FLAGS = 0x0800  # nomes em UTF-8
+DEFLATE = 8
+VERSION = 20
+MADE_BY = (3 << 8) | VERSION  # Unix, para que as permissoes sejam respeitadas
+EXTERNAL_ATTR = 0o100644 << 16
+
+
+def _deflate(blob, level):
+    c = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return c.compress(blob) + c.flush()
+
+
+def collect_assets(assets_dir):
+    """{nome no zip: bytes} de todos os arquivos sob assets_dir, se existir."""
+    members = {}
+    if not assets_dir or not os.path.isdir(assets_dir):
+        return members
+    for root, _, names in os.walk(assets_dir):
+        for name in names:
+            path = os.path.join(root, name)
+            rel = os.path.relpath(path, assets_dir).replace(os.sep, "/")
+            with open(path, "rb") as f:
+                members[f"assets/{rel}"] = f.read()
+    return members
+
+
+def pack_members(manifest_bytes, files, assets_dir=None):
+    """Monta {nome: bytes} do pacote: manifest + challenges/ + assets/ opcional."""
+    members = {"manifest.json": manifest_bytes}
+    for cid, blob in files.items():
+        members[f"challenges/{cid}.json"] = blob
+    members.update(collect_assets(assets_dir))
+    return members
+
+
+def zip_bytes(members, workers=None, level=COMPRESS_LEVEL):
+    """
+    Monta o zip a partir de {nome: bytes} e retorna os bytes do arquivo.
+
+    Exemplo de members: {"manifest.json": ..., "challenges/html-ini-001.json": ...}
+    """
+    names = sorted(members)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        compressed = list(pool.map(lambda name: _deflate(members[name], level), names))
+
+    out = []
+    central = []
+    offset = 0
+    for name, data in zip(names, compressed):
+        raw = members[name]
+        encoded = name.encode("utf-8")
+        crc = zlib.crc32(raw)
+        if offset > 0xFFFFFFFF or len(raw) > 0xFFFFFFFF:
+            raise ValueError("Pacote grande demais para zip sem ZIP64.")
+
+        # Local file header: assinatura, versao, flags, metodo, hora, data, crc, tamanhos, nome, extra
+        local = struct.pack("<IHHHHHIIIHH", 0x04034B50, VERSION, FLAGS, DEFLATE, DOS_TIME, DOS_DATE,
+                            crc, len(data), len(raw), len(encoded), 0)
+        out += [local, encoded, data]
+
+        # Entrada do diretorio central (mesmos campos + atributos e offset do header local)
+        central.append(struct.pack("<IHHHHHHIIIHHHHHII", 0x02014B50, MADE_BY, VERSION, FLAGS, DEFLATE,
+                                   DOS_TIME, DOS_DATE, crc, len(data), len(raw), len(encoded),
+                                   0, 0, 0, 0, EXTERNAL_ATTR, offset) + encoded)
+        offset += len(local) + len(encoded) + len(data)
+
+    directory = b"".join(central)
+    # End of central directory: disco, disco do diretorio, contagens, tamanho, offset, comentario
+    end = struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, len(names), len(names), len(directory), offset, 0)
+    return b"".join(out) + directory + end
@@ -0,0 +1,113 @@
+"""
+Documentos de preview pre-renderizados para o starterCode de HTML e CSS.
+
+- HTML: html_starter() ja gera um documento completo; so garantimos doctype
+  e charset (starters escritos a mao podem ser fragmentos).
+- CSS: css()/css_starter() geram "<style>...</style>" seguido de um fragmento
+  HTML; os blocos <style> vao para o <head> e o resto para o <body>.
+
+O resultado e um documento normalizado que o painel de preview pode mostrar
+direto, sem montar nada ao carregar o desafio. O PreviewCache guarda os
+documentos por SHA-256 de (versao, trilha, starter).
+"""
+import hashlib
+import json
+import re
+
+PREVIEW_TRACKS = ("html", "css")
+# Incrementar quando a normalizacao mudar: documentos em cache com a chave antiga sao refeitos
+PREVIEW_VERSION = 1
+
+_DOCTYPE = re.compile(r"^\s*<!DOCTYPE html>", re.IGNORECASE)
+_CHARSET = re.compile(r"<meta\s+charset=", re.IGNORECASE)
+_HEAD_OPEN = re.compile(r"<head[^>]*>", re.IGNORECASE)
+_HTML_OPEN = re.compile(r"<html[^>]*>", re.IGNORECASE)
+_STYLE = re.compile(r"<style[^>]*>.*?</style>", re.IGNORECASE | re.DOTALL)
+
+
+def _document(head, body):
+    return ('<!DOCTYPE html>\n<html lang="pt-BR">\n<head>\n    <meta charset="UTF-8">\n'
+            f"{head}</head>\n<body>\n{body}\n</body>\n</html>")
+
+
+def _normalize_css(starter):
+    styles = _STYLE.findall(starter)
+    body = _STYLE.sub("", starter).strip()
+    head = "".join(f"    {style.strip()}\n" for style in styles)
+    return _document(head, body)
+
+
+def _normalize_html(starter):
+    if not _HTML_OPEN.search(starter):
+        # Fragmento (ex.: css_starter usado na trilha de HTML): mesmo tratamento do CSS
+        return _normalize_css(starter)
+    doc = starter
+    if not _CHARSET.search(doc):
+        head = _HEAD_OPEN.search(doc)
+        if head:
+            doc = doc[:head.end()] + '\n    <meta charset="UTF-8">' + doc[head.end():]
+        else:
+            tag = _HTML_OPEN.search(doc)
+            doc = doc[:tag.end()] + '\n<head>\n    <meta charset="UTF-8">\n</head>' + doc[tag.end():]
+    if not _DOCTYPE.match(doc):
+        doc = "<!DOCTYPE html>\n" + doc.lstrip()
+    return doc
+
+
+def preview_document(track, starter):
+    """Documento de preview do starter, ou None para trilhas sem preview estatico."""
+    starter = starter.replace("\r\n", "\n")
+    if track == "html":
+        return _normalize_html(starter)
+    if track == "css":
+        return _normalize_css(starter)
+    return None
+
+
+def starter_hash(track, starter):
+    return hashlib.sha256(f"{PREVIEW_VERSION}\0{track}\0{starter}".encode("utf-8")).hexdigest()
+
+
+class PreviewCache:
+    """Cache {sha256(versao, trilha, starter): documento} persistido em JSON."""
+
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(json.load(f))
+        except FileNotFoundError:
+            return cls()
+
+    def document(self, track, starter):
+        if track not in PREVIEW_TRACKS:
+            return None
+        key = starter_hash(track, starter)
+        doc = self.entries.get(key)
+        if doc is None:
+            self.misses += 1
+            doc = self.entries[key] = preview_document(track, starter)
+        return doc
+
+    def prune(self, keys):
+        keep = set(keys)
+        self.entries = {k: v for k, v in self.entries.items() if k in keep}
+
+    def to_bytes(self):
+        return json.dumps(dict(sorted(self.entries.items())), ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def render_previews(records, cache):
+    """{id: bytes do documento} para os desafios de HTML e CSS."""
+    previews = {}
+    for data in records:
+        doc = cache.document(data.get("track"), data.get("starterCode", ""))
+        if doc is not None:
+            previews[data["id"]] = doc.encode("utf-8")
+    cache.prune(starter_hash(d.get("track"), d.get("starterCode", "")) for d in records
+                if d.get("track") in PREVIEW_TRACKS)
+    return previews
@@ -0,0 +1,563 @@
+"""
+Verificador das regras de HTML/CSS contra a solucao de referencia.
+
+Cada desafio de html-rules/css-rules pode trazer um referenceSolution. Aqui
+as regras do validatorConfig sao avaliadas contra ele com a mesma semantica
+dos validadores do app (HtmlValidator e CssValidator), sem .NET:
+
+    element-exists / element-count / attribute-exists / attribute-value /
+    text-contains     -> DOM + seletores (querySelector/querySelectorAll)
+    css-property / css-rule-exists -> analise textual por blocos '{...}'
+
+Cada documento e lido uma vez so: o HTML vira uma arvore com indices por
+tag, atributo, id e classe, e as consultas de todas as regras do desafio
+saem desse indice (com memo por seletor). Os desafios sao verificados num
+pool de processos.
+
+Alem da solucao, as regras passam por um lint: chaves que o app nao le
+(ex.: "value" ou "min" no lugar de "expectedValue"), tipos nao suportados
+pelo validador e expectedValue invalido no element-count.
+
+Uso:
+    python rule_verifier.py                    # todos os arquivos de challenges/
+    python rule_verifier.py --jobs 4 --strict
+    python rule_verifier.py challenges/html-ini-001.json
+
+Sai com codigo 1 se alguma regra falhar.
+"""
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+RULE_KEYS = frozenset(("type", "selector", "property", "expectedValue", "attribute",
+                       "errorMessage", "successMessage"))
+HTML_RULES = frozenset(("element-exists", "element-count", "attribute-exists", "attribute-value", "text-contains"))
+CSS_RULES = frozenset(("css-property", "css-rule-exists"))
+VALIDATORS = {"html-rules": HTML_RULES, "css-rules": CSS_RULES}
+
+# ===================== DOM =====================
+
+VOID = frozenset(("area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+                  "param", "source", "track", "wbr"))
+HEAD_TAGS = frozenset(("base", "link", "meta", "noscript", "script", "style", "template", "title"))
+BLOCKS = frozenset(("address", "article", "aside", "blockquote", "details", "dialog", "div", "dl",
+                    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5",
+                    "h6", "header", "hr", "main", "menu", "nav", "ol", "p", "pre", "section", "table", "ul"))
+# Fechamentos implicitos mais comuns do HTML5: tag aberta -> tags que ela fecha
+IMPLIED_END = {tag: ("p",) for tag in BLOCKS}
+IMPLIED_END.update({
+    "li": ("li", "p"), "dt": ("dt", "dd", "p"), "dd": ("dt", "dd", "p"), "option": ("option",),
+    "tr": ("td", "th", "tr"), "td": ("td", "th"), "th": ("td", "th"),
+    "thead": ("tbody", "tfoot", "tr", "td", "th"), "tbody": ("thead", "tbody", "tfoot", "tr", "td", "th"),
+    "tfoot": ("thead", "tbody", "tr", "td", "th"),
+})
+
+
+class Element:
+    __slots__ = ("tag", "attrs", "parent", "prev", "children", "order")
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.parent = parent
+        self.prev = None
+        self.children = []
+        self.order = -1
+
+    def append(self, child):
+        for node in reversed(self.children):
+            if isinstance(node, Element):
+                child.prev = node
+                break
+        child.parent = self
+        self.children.append(child)
+
+    def text(self):
+        """textContent: todo o texto descendente, em ordem."""
+        return "".join(node if isinstance(node, str) else node.text() for node in self.children)
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+
+class _TreeBuilder(HTMLParser):
+    """
+    Arvore no estilo do parser HTML5, no que importa para as regras: html,
+    head e body sempre existem, conteudo de cabecalho vai para head, void
+    elements nao tem filhos, fechamentos implicitos de p/li/dt/dd/option e
+    tabela (com tbody implicito), e o conteudo de <template> fica fora do
+    documento (o querySelector nao ve).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.html = Element("html")
+        self.head = Element("head")
+        self.body = Element("body")
+        self.html.append(self.head)
+        self.html.append(self.body)
+        self.stack = [self.head]
+        self.in_body = False
+
+    def _enter_body(self):
+        if not self.in_body:
+            self.in_body = True
+            self.stack = [self.body]
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: value if value is not None else "" for name, value in reversed(attrs)}
+        if tag in ("html", "body", "head"):
+            node = getattr(self, tag)
+            node.attrs = {**attrs, **node.attrs}
+            if tag == "body":
+                self._enter_body()
+            return
+        if not self.in_body and tag not in HEAD_TAGS:
+            self._enter_body()
+        current = self.stack[-1]
+        while current.tag in IMPLIED_END.get(tag, ()) and len(self.stack) > 1:
+            self.stack.pop()
+            current = self.stack[-1]
+        if tag == "tr" and current.tag == "table":
+            tbody = Element("tbody")
+            current.append(tbody)
+            self.stack.append(tbody)
+            current = tbody
+        node = Element(tag, attrs)
+        current.append(node)
+        if tag not in VOID:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        # <circle/> no SVG fecha na hora; <br/> ja e void
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID and self.stack[-1].tag == tag:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self._enter_body()
+            return
+        if tag in ("html", "body"):
+            return
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                return
+
+    def handle_data(self, data):
+        if not self.in_body and not data.strip():
+            return
+        if not self.in_body and self.stack[-1] is self.head:
+            self._enter_body()
+        self.stack[-1].children.append(data)
+
+
+class HtmlDocument:
+    """
+    Documento parseado uma vez, com os elementos em ordem de documento e
+    indices por tag, atributo, id e classe. select() responde seletores CSS
+    a partir dos indices e guarda o resultado por seletor.
+    """
+
+    def __init__(self, source):
+        builder = _TreeBuilder()
+        builder.feed(source)
+        builder.close()
+        self.root = builder.html
+        self.elements = []
+        self.by_tag = {}
+        self.by_attr = {}
+        self.by_id = {}
+        self.by_class = {}
+        self._index(self.root)
+        self._memo = {}
+
+    def _index(self, node):
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            node.order = len(self.elements)
+            self.elements.append(node)
+            self.by_tag.setdefault(node.tag, []).append(node)
+            for name in node.attrs:
+                self.by_attr.setdefault(name, []).append(node)
+            if "id" in node.attrs:
+                self.by_id.setdefault(node.attrs["id"], []).append(node)
+            for cls in node.classes:
+                self.by_class.setdefault(cls, []).append(node)
+            if node.tag != "template":
+                pending.extend(c for c in reversed(node.children) if isinstance(c, Element))
+
+    def _candidates(self, compound):
+        tag, ids, classes, attrs = compound
+        if ids:
+            return self.by_id.get(ids[0], ())
+        if tag:
+            return self.by_tag.get(tag, ())
+        if attrs:
+            return self.by_attr.get(attrs[0][0], ())
+        if classes:
+            return self.by_class.get(classes[0], ())
+        return self.elements
+
+    def select(self, selector):
+        """querySelectorAll: elementos em ordem de documento (ValueError se o seletor for invalido)."""
+        if selector not in self._memo:
+            found = {}
+            for chain in parse_selector(selector):
+                for node in self._candidates(chain[-1][1]):
+                    if node.order not in found and _match_chain(node, chain, len(chain) - 1):
+                        found[node.order] = node
+            self._memo[selector] = [found[k] for k in sorted(found)]
+        return self._memo[selector]
+
+    def select_one(self, selector):
+        hits = self.select(selector)
+        return hits[0] if hits else None
+
+
+# ===================== SELETORES =====================
+
+_TOKEN = re.compile(r"""
+    \s*(?P<comb>[>+~,])\s*
+  | (?P<ws>\s+)
+  | (?P<tag>\*|[a-zA-Z][\w-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?:'(?P<sq>[^']*)'|"(?P<dq>[^"]*)"|(?P<bare>[^\]\s]+))\s*)?\]
+""", re.VERBOSE)
+
+_selector_cache = {}
+
+
+def parse_selector(text):
+    """
+    Lista de alternativas (virgula); cada uma e [(combinador, composto)] da
+    esquerda para a direita, com composto = (tag, ids, classes, atributos).
+    Suporta tipo, *, #id, .classe, [attr], [attr op valor] e os combinadores
+    descendente, >, + e ~. Pseudo-classes levantam ValueError.
+    """
+    if text in _selector_cache:
+        return _selector_cache[text]
+    chains, chain, compound, comb = [], [], None, " "
+    pos, text_s = 0, text.strip()
+    if not text_s:
+        raise ValueError("Seletor vazio.")
+
+    def close():
+        nonlocal compound
+        if compound is not None:
+            chain.append((comb, (compound[0], tuple(compound[1]), tuple(compound[2]), tuple(compound[3]))))
+            compound = None
+
+    while pos < len(text_s):
+        m = _TOKEN.match(text_s, pos)
+        if not m or m.end() == pos:
+            raise ValueError(f"Seletor nao suportado: '{text}'")
+        pos = m.end()
+        if m.group("comb") or m.group("ws"):
+            if compound is None:
+                raise ValueError(f"Seletor invalido: '{text}'")
+            close()
+            symbol = m.group("comb") or " "
+            if symbol == ",":
+                chains.append(chain)
+                chain, comb = [], " "
+            else:
+                comb = symbol
+            continue
+        if compound is None:
+            compound = [None, [], [], []]
+        if m.group("tag"):
+            if compound[0] is not None or compound[1] or compound[2] or compound[3]:
+                raise ValueError(f"Seletor invalido: '{text}'")
+            compound[0] = None if m.group("tag") == "*" else m.group("tag").lower()
+        elif m.group("id"):
+            compound[1].append(m.group("id"))
+        elif m.group("cls"):
+            compound[2].append(m.group("cls"))
+        else:
+            value = next((v for v in m.group("sq", "dq", "bare") if v is not None), None)
+            compound[3].append((m.group("attr").lower(), m.group("op"), value))
+    if compound is None:
+        raise ValueError(f"Seletor invalido: '{text}'")
+    close()
+    chains.append(chain)
+    _selector_cache[text] = chains
+    return chains
+
+
+def _attr_match(node, name, op, value):
+    actual = node.attrs.get(name)
+    if actual is None:
+        return False
+    if op is None:
+        return True
+    if op == "=":
+        return actual == value
+    if op == "~=":
+        return value in actual.split()
+    if op == "|=":
+        return actual == value or actual.startswith(value + "-")
+    if not value:
+        return False
+    if op == "^=":
+        return actual.startswith(value)
+    if op == "$=":
+        return actual.endswith(value)
+    return value in actual  # *=
+
+
+def _match_compound(node, compound):
+    tag, ids, classes, attrs = compound
+    if tag and node.tag != tag:
+        return False
+    if ids and any(node.attrs.get("id") != i for i in ids):
+        return False
+    if classes and not set(classes) <= set(node.classes):
+        return False
+    return all(_attr_match(node, *attr) for attr in attrs)
+
+
+def _match_chain(node, chain, i):
+    comb, compound = chain[i]
+    if not _match_compound(node, compound):
+        return False
+    if i == 0:
+        return True
+    if comb == ">":
+        return node.parent is not None and _match_chain(node.parent, chain, i - 1)
+    if comb == "+":
+        return node.prev is not None and _match_chain(node.prev, chain, i - 1)
+    step = "prev" if comb == "~" else "parent"
+    other = getattr(node, step)
+    while other is not None:
+        if _match_chain(other, chain, i - 1):
+            return True
+        other = getattr(other, step)
+    return False
+
+
+# ===================== CSS (analise textual, como o CssValidator) =====================
+
+class CssDocument:
+    """
+    Blocos 'seletor { declaracoes }' do codigo todo em minusculas, do mesmo
+    jeito que o CssValidator: o texto antes de cada '{' e o seletor (inclui
+    o que vier antes, como <style> e comentarios) e o bloco termina no
+    primeiro '}'. Um seletor de regra casa com um bloco igual ou contido.
+    """
+
+    def __init__(self, source):
+        css = source.lower().replace("\r\n", "\n").replace("\r", "\n")
+        self.blocks = []
+        i = 0
+        while True:
+            start = css.find("{", i)
+            end = css.find("}", start) if start >= 0 else -1
+            if end < 0:
+                break
+            props = []
+            for decl in css[start + 1:end].strip().split(";"):
+                name, colon, value = decl.partition(":")
+                if colon and name:
+                    props.append((name.strip(), value.strip()))
+            self.blocks.append((css[i:start].strip(), props))
+            i = end + 1
+        self._memo = {}
+
+    def matching(self, selector):
+        """Blocos que casam com o seletor, em ordem."""
+        selector = (selector or "").strip().lower()
+        if selector not in self._memo:
+            self._memo[selector] = [props for sel, props in self.blocks if sel == selector or selector in sel]
+        return self._memo[selector]
+
+
+# ===================== REGRAS =====================
+
+def _int(text):
+    """int.TryParse do C# (espacos nas pontas e sinal aceitos)."""
+    try:
+        return int((text or "").strip())
+    except ValueError:
+        return None
+
+
+def _same(a, b):
+    """string.Equals(a?.Trim(), b?.Trim(), OrdinalIgnoreCase)."""
+    if a is None or b is None:
+        return a is None and b is None
+    return a.strip().casefold() == b.strip().casefold()
+
+
+def check_html_rule(doc, rule):
+    kind = rule.get("type", "").lower()
+    selector = rule.get("selector") or ""
+    expected = rule.get("expectedValue")
+    if kind == "element-exists":
+        return bool(doc.select(selector))
+    if kind == "element-count":
+        count = _int(expected)
+        return len(doc.select(selector)) >= (1 if count is None else count)
+    node = doc.select_one(selector)
+    if kind == "attribute-exists":
+        return node is not None and (rule.get("attribute") or "").lower() in node.attrs
+    if kind == "attribute-value":
+        return node is not None and _same(node.attrs.get((rule.get("attribute") or "").lower()), expected)
+    if kind == "text-contains":
+        return node is not None and (expected or "").casefold() in node.text().casefold()
+    raise ValueError(f"Tipo de regra nao suportado: {rule.get('type')}")
+
+
+def check_css_rule(doc, rule, strict=False):
+    kind = rule.get("type", "").lower()
+    blocks = doc.matching(rule.get("selector"))
+    prop = (rule.get("property") or "").strip().lower()
+    if kind == "css-property":
+        if not blocks:
+            return False
+        expected = (rule.get("expectedValue") or "").strip().lower().replace(" ", "")
+        return any(name == prop and value.replace(" ", "") == expected for name, value in blocks[0])
+    if kind == "css-rule-exists":
+        # O app so exige o bloco; no modo estrito a propriedade tambem precisa aparecer nele
+        if strict and prop:
+            return any(name == prop for props in blocks for name, _ in props)
+        return bool(blocks)
+    raise ValueError(f"Tipo de regra nao suportado: {rule.get('type')}")
+
+
+def lint_rules(data):
+    """Problemas de configuracao que fazem o app ignorar ou recusar uma regra."""
+    problems = []
+    allowed = VALIDATORS.get(data.get("validatorType"), ())
+    for n, rule in enumerate((data.get("validatorConfig") or {}).get("rules") or [], 1):
+        kind = rule.get("type", "")
+        unknown = sorted(set(rule) - RULE_KEYS)
+        if unknown:
+            problems.append((n, f"chave(s) ignorada(s) pelo app: {', '.join(unknown)} (use expectedValue)"))
+        if kind.lower() not in allowed:
+            problems.append((n, f"tipo '{kind}' nao suportado por {data.get('validatorType')}"))
+        if kind.lower() == "element-count" and "expectedValue" in rule and _int(rule["expectedValue"]) is None:
+            problems.append((n, f"expectedValue '{rule['expectedValue']}' nao e um inteiro"))
+        if kind.lower() in ("attribute-value", "css-property") and "expectedValue" not in rule:
+            problems.append((n, "sem expectedValue"))
+        if "expectedValue" in rule and not isinstance(rule["expectedValue"], str):
+            problems.append((n, "expectedValue precisa ser string"))
+    return problems
+
+
+def evaluate(data, code, strict=False):
+    """
+    Avalia todas as regras do desafio contra um codigo, parseando-o uma vez.
+    Retorna [(regra, passou, erro)], com erro preenchido quando a avaliacao
+    levantou excecao (a regra conta como falha, como no app).
+    """
+    html = data.get("validatorType") == "html-rules"
+    doc = HtmlDocument(code) if html else CssDocument(code)
+    results = []
+    for n, rule in enumerate((data.get("validatorConfig") or {}).get("rules") or [], 1):
+        try:
+            passed = check_html_rule(doc, rule) if html else check_css_rule(doc, rule, strict)
+        except Exception as ex:
+            results.append((n, False, str(ex)))
+            continue
+        results.append((n, passed, None))
+    return results
+
+
+def verify_record(data, strict=False):
+    """
+    Verifica um desafio. Retorna {"id", "checked", "problems": [(regra, msg)]},
+    com checked False quando nao ha solucao de referencia (so o lint roda).
+    """
+    problems = lint_rules(data)
+    solution = data.get("referenceSolution")
+    if solution is None:
+        return {"id": data["id"], "checked": False, "problems": problems}
+    try:
+        results = evaluate(data, solution, strict)
+    except Exception as ex:  # documento que nem parseia: todas as regras falham
+        return {"id": data["id"], "checked": True, "problems": problems + [(0, f"erro no parsing: {ex}")]}
+    rules = data["validatorConfig"]["rules"]
+    for n, passed, error in results:
+        if error is not None:
+            problems.append((n, f"erro ao avaliar: {error}"))
+        elif not passed:
+            rule = rules[n - 1]
+            label = " ".join(filter(None, (rule.get("type"), rule.get("selector"), rule.get("attribute"),
+                                           rule.get("property"), rule.get("expectedValue"))))
+            problems.append((n, f"falhou ({label}): {rule.get('errorMessage', '')}"))
+    return {"id": data["id"], "checked": True, "problems": problems}
+
+
+def _verify_chunk(items, strict):
+    return [verify_record(data, strict) for data in items]
+
+
+def verify_records(records, jobs=1, strict=False):
+    """
+    Verifica os desafios de html-rules/css-rules, na ordem recebida. Com
+    jobs > 1 (0 = numero de CPUs) os desafios vao em lotes para um pool.
+    """
+    records = [d for d in records if d.get("validatorType") in VALIDATORS]
+    workers = jobs or os.cpu_count() or 1
+    if workers == 1 or len(records) < 2:
+        return _verify_chunk(records, strict)
+    size = max(1, -(-len(records) // (workers * 4)))
+    chunks = [records[i:i + size] for i in range(0, len(records), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [r for chunk in pool.map(_verify_chunk, chunks, [strict] * len(chunks)) for r in chunk]
+
+
+def print_report(results):
+    """Imprime falhas e resumo. Retorna o numero de desafios com problema."""
+    failed = [r for r in results if r["problems"]]
+    for r in failed:
+        print(r["id"])
+        for n, message in r["problems"]:
+            print(f"  regra {n}: {message}" if n else f"  {message}")
+    checked = sum(r["checked"] for r in results)
+    print(f"Regras: {len(results)} desafio(s) de HTML/CSS, {checked} com solucao de referencia, "
+          f"{len(failed)} com problema.")
+    return len(failed)
+
+
+def load_records(paths):
+    records = []
+    for path in paths:
+        names = sorted(os.path.join(path, n) for n in os.listdir(path) if n.endswith(".json")) \
+            if os.path.isdir(path) else [path]
+        for name in names:
+            with open(name, "r", encoding="utf-8") as f:
+                records.append(json.load(f))
+    return records
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Verifica as regras de HTML/CSS contra as solucoes de referencia.")
+    parser.add_argument("paths", nargs="*", default=[os.path.join(ROOT, "challenges")],
+                        help="arquivos ou pastas de desafios (padrao: challenges/)")
+    parser.add_argument("--jobs", type=int, default=0, help="processos (0 = numero de CPUs, padrao)")
+    parser.add_argument("--strict", action="store_true",
+                        help="css-rule-exists tambem exige a propriedade declarada no bloco")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = verify_records(load_records(args.paths), args.jobs, args.strict)
+    failed = print_report(results)
+    print(f"Tempo: {time.perf_counter() - start:.2f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
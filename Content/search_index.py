@@ -0,0 +1,118 @@
+"""
+Indice invertido de busca sobre titulos, descricoes e tags.
+
+Os tokens sao normalizados sem acento e em minusculas ("Parágrafo" e
+"paragrafo" viram o mesmo termo), entao a busca da lista vira um lookup em
+vez de varrer todos os registros.
+
+Formato (JSON):
+
+    {
+      "version": 1,
+      "ids": ["css-adv-001", ...],             # ordinal -> id
+      "terms": {"paragrafo": [[ordinal, peso], ...], ...},
+      "prefixes": {"pa": ["paragrafo", "padding", ...], ...}
+    }
+
+Pesos: titulo 3, tag 2, descricao 1 (somados quando o termo aparece em mais
+de um campo). Prefixos a partir de MIN_PREFIX letras apontam para os termos
+completos, para busca enquanto o usuario digita.
+"""
+import json
+import re
+import unicodedata
+
+VERSION = 1
+MIN_PREFIX = 2
+FIELD_WEIGHTS = (("title", 3), ("tags", 2), ("description", 1))
+STOPWORDS = {"a", "o", "e", "de", "da", "do", "das", "dos", "em", "um", "uma", "com", "que", "para", "por", "se", "os", "as", "no", "na"}
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def fold(text):
+    """Remove acentos e passa para minusculas."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def tokenize(text):
+    return [tok for tok in _TOKEN.findall(fold(text)) if tok not in STOPWORDS]
+
+
+def _field_text(data, field):
+    value = data.get(field, "")
+    return " ".join(value) if isinstance(value, list) else value
+
+
+def build_index(records):
+    """Monta o indice a partir dos registros. Saida deterministica (ordem de id)."""
+    records = sorted(records, key=lambda data: data["id"])
+    terms = {}
+    for ordinal, data in enumerate(records):
+        weights = {}
+        for field, weight in FIELD_WEIGHTS:
+            for tok in set(tokenize(_field_text(data, field))):
+                weights[tok] = weights.get(tok, 0) + weight
+        for tok, weight in sorted(weights.items()):
+            terms.setdefault(tok, []).append([ordinal, weight])
+
+    prefixes = {}
+    for term in sorted(terms):
+        for n in range(MIN_PREFIX, len(term)):
+            prefixes.setdefault(term[:n], []).append(term)
+
+    return {
+        "version": VERSION,
+        "ids": [data["id"] for data in records],
+        "terms": dict(sorted(terms.items())),
+        "prefixes": prefixes,
+    }
+
+
+def index_bytes(records):
+    return json.dumps(build_index(records), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class SearchIndex:
+    """Consulta ao indice. Todos os tokens precisam casar (AND); o ultimo casa por prefixo."""
+
+    def __init__(self, index):
+        if index.get("version") != VERSION:
+            raise ValueError(f"Versao de indice de busca nao suportada: {index.get('version')}")
+        self.ids = index["ids"]
+        self.terms = index["terms"]
+        self.prefixes = index["prefixes"]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _postings(self, token, prefix):
+        """{ordinal: peso} para um token; com prefix=True junta todos os termos que comecam com ele."""
+        matches = [token] if token in self.terms else []
+        if prefix:
+            matches += self.prefixes.get(token, [])
+        scores = {}
+        for term in matches:
+            for ordinal, weight in self.terms[term]:
+                scores[ordinal] = max(scores.get(ordinal, 0), weight)
+        return scores
+
+    def search(self, query, limit=None):
+        """Ids que casam com a consulta, do maior para o menor peso (empate por id)."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        total = None
+        for i, token in enumerate(tokens):
+            scores = self._postings(token, prefix=(i == len(tokens) - 1))
+            if total is None:
+                total = scores
+            else:
+                total = {o: total[o] + w for o, w in scores.items() if o in total}
+            if not total:
+                return []
+        ranked = sorted(total.items(), key=lambda item: (-item[1], item[0]))
+        ids = [self.ids[ordinal] for ordinal, _ in ranked]
+        return ids[:limit] if limit else ids
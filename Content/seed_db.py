@@ -0,0 +1,136 @@
+"""
+Banco SQLite de seed gerado pelo build.
+
+Produz um codegym.db com o mesmo schema do DatabaseInitializer (todas as
+tabelas, para que o CREATE TABLE IF NOT EXISTS do app vire no-op) e a tabela
+Challenges ja populada, indexada e compactada com VACUUM. No primeiro uso o
+app so precisa copiar o arquivo, sem o loop de parse + INSERT.
+
+O arquivo e reproduzivel byte a byte para as mesmas entradas (e a mesma
+versao da biblioteca SQLite): os desafios sao inseridos em ordem de id, sem
+timestamps, e o VACUUM final reescreve as paginas em ordem.
+"""
+import json
+import os
+import sqlite3
+import tempfile
+
+# Mantido em sincronia com src/CodeGym.Storage/DatabaseInitializer.cs
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS Challenges (
+    Id TEXT PRIMARY KEY,
+    Track TEXT NOT NULL,
+    Title TEXT NOT NULL,
+    Description TEXT NOT NULL,
+    StarterCode TEXT NOT NULL DEFAULT '',
+    Tags TEXT NOT NULL DEFAULT '[]',
+    Difficulty TEXT NOT NULL DEFAULT 'Iniciante',
+    ValidatorType TEXT NOT NULL,
+    ValidatorConfig TEXT NOT NULL DEFAULT '{}',
+    PackageName TEXT NOT NULL DEFAULT 'base'
+);
+CREATE TABLE IF NOT EXISTS Attempts (
+    Id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ChallengeId TEXT NOT NULL,
+    SubmittedCode TEXT NOT NULL,
+    Passed INTEGER NOT NULL DEFAULT 0,
+    TestsPassed INTEGER NOT NULL DEFAULT 0,
+    TestsTotal INTEGER NOT NULL DEFAULT 0,
+    ResultMessage TEXT NOT NULL DEFAULT '',
+    TimeSpentSeconds INTEGER NOT NULL DEFAULT 0,
+    Timestamp TEXT NOT NULL DEFAULT (datetime('now','localtime')),
+    FOREIGN KEY (ChallengeId) REFERENCES Challenges(Id)
+);
+CREATE TABLE IF NOT EXISTS SavedCode (
+    ChallengeId TEXT PRIMARY KEY,
+    Code TEXT NOT NULL,
+    LastModified TEXT NOT NULL DEFAULT (datetime('now','localtime')),
+    FOREIGN KEY (ChallengeId) REFERENCES Challenges(Id)
+);
+CREATE TABLE IF NOT EXISTS Notes (
+    Id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ChallengeId TEXT NOT NULL,
+    Content TEXT NOT NULL DEFAULT '',
+    CreatedAt TEXT NOT NULL DEFAULT (datetime('now','localtime')),
+    ModifiedAt TEXT NOT NULL DEFAULT (datetime('now','localtime')),
+    FOREIGN KEY (ChallengeId) REFERENCES Challenges(Id)
+);
+CREATE TABLE IF NOT EXISTS Achievements (
+    Id INTEGER PRIMARY KEY AUTOINCREMENT,
+    AchievementId TEXT NOT NULL UNIQUE,
+    UnlockedAt TEXT NOT NULL DEFAULT (datetime('now','localtime'))
+);
+CREATE TABLE IF NOT EXISTS Settings (
+    Key TEXT PRIMARY KEY,
+    Value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS Favorites (
+    Id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ChallengeId TEXT NOT NULL UNIQUE,
+    AddedAt TEXT NOT NULL DEFAULT (datetime('now','localtime')),
+    FOREIGN KEY (ChallengeId) REFERENCES Challenges(Id)
+);
+"""
+
+# Indices criados depois da carga: mais rapido que manter durante os INSERTs
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_attempts_challenge ON Attempts(ChallengeId);
+CREATE INDEX IF NOT EXISTS idx_attempts_timestamp ON Attempts(Timestamp);
+CREATE INDEX IF NOT EXISTS idx_challenges_track ON Challenges(Track);
+CREATE INDEX IF NOT EXISTS idx_notes_challenge ON Notes(ChallengeId);
+CREATE INDEX IF NOT EXISTS idx_favorites_challenge ON Favorites(ChallengeId);
+"""
+
+
+def _compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _row(data, package_name):
+    return (
+        data["id"],
+        data["track"],
+        data["title"],
+        data["description"],
+        data.get("starterCode", ""),
+        _compact(data.get("tags", [])),
+        data.get("difficulty", "Iniciante"),
+        data["validatorType"],
+        _compact(data.get("validatorConfig", {})),
+        package_name,
+    )
+
+
+def seed_bytes(records, package_name="base"):
+    """
+    Gera o banco de seed e retorna seus bytes.
+
+    records devem estar na forma lida pelo app (testCode expandido). O banco e
+    montado num arquivo temporario, que e apagado no final.
+    """
+    fd, tmp_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.execute("PRAGMA page_size=4096")
+        conn.executescript(SCHEMA)
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT INTO Challenges (Id, Track, Title, Description, StarterCode, Tags, Difficulty,"
+            " ValidatorType, ValidatorConfig, PackageName) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [_row(data, package_name) for data in sorted(records, key=lambda d: d["id"])])
+        conn.execute("COMMIT")
+        conn.executescript(INDEXES)
+        conn.execute("ANALYZE")
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    try:
+        with open(tmp_path, "rb") as f:
+            return f.read()
+    finally:
+        os.remove(tmp_path)
@@ -0,0 +1,266 @@
+"""
+Verificador das duas formas de cada template de validacao.
+
+Os desafios de js-tests e csharp-tests existem em duas formas (ver
+templates.py): o testCode expandido, que vai para challenges/ e para o .zip,
+e a forma compacta do bundle (prelude + body()). Aqui as duas rodam contra o
+starterCode de cada desafio e a lista de resultados (pass + mensagem de cada
+teste) tem que ser identica. Os starters nao resolvem o desafio, entao a
+maioria dos testes falha; o que importa e que falhem do mesmo jeito. Uma
+forma que nem compila ou roda tambem e problema.
+
+    js-tests      todos os desafios num unico processo do Node.js (node no PATH)
+    csharp-tests  um projeto temporario com todos os desafios, compilado uma
+                  vez so pelo dotnet (dotnet no PATH), cada forma no seu
+                  namespace
+
+Sem o runtime da trilha, ela e pulada com aviso.
+
+Uso:
+    python template_verifier.py     # registros compactos de generate_js.py e generate_csharp.py
+
+Sai com codigo 1 se alguma forma divergir.
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+
+import templates
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TIMEOUT = 600
+
+# Codigo do aluno + testCode no mesmo contexto, como o JavaScriptValidator
+JS_RUNNER = r"""
+const vm = require('vm');
+const items = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const run = (code, tests) => {
+  const ctx = vm.createContext({ console: { log: () => {} } });
+  try {
+    vm.runInContext(code, ctx, { timeout: 10000 });
+    vm.runInContext(tests, ctx, { timeout: 10000 });
+    const r = vm.runInContext('__runTests()', ctx, { timeout: 10000 });
+    return (Array.isArray(r) ? r : []).map((t) => [Boolean(t.pass !== undefined ? t.pass : t.passed), String(t.message)]);
+  } catch (e) { return 'erro: ' + e.message; }
+};
+process.stdout.write(JSON.stringify(items.map(([code, expanded, compact]) => [run(code, expanded), run(code, compact)])));
+"""
+
+CS_PROJECT = """<Project Sdk="Microsoft.NET.Sdk">
+  <PropertyGroup>
+    <OutputType>Exe</OutputType>
+    <TargetFramework>net8.0</TargetFramework>
+    <ImplicitUsings>disable</ImplicitUsings>
+    <Nullable>disable</Nullable>
+    <StartupObject>TemplateCheck</StartupObject>
+    <NoWarn>$(NoWarn);CS0162;CS0168;CS0219;CS0414;CS1998;CS8321</NoWarn>
+  </PropertyGroup>
+</Project>
+"""
+
+# Roda o TestRunner.RunTests() de cada namespace e imprime {namespace: resultados}
+CS_RUNNER = """using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Text.Json;
+
+public static class TemplateCheck
+{
+    public static void Main()
+    {
+        var stdout = Console.Out;
+        Console.SetOut(TextWriter.Null);
+        var all = new SortedDictionary<string, object>();
+        foreach (var type in typeof(TemplateCheck).Assembly.GetTypes().Where(t => t.Name == "TestRunner"))
+        {
+            try
+            {
+                var results = (IEnumerable)type.GetMethod("RunTests").Invoke(null, null);
+                all[type.Namespace] = results.Cast<object>().Select(r => new object[] {
+                    (bool)r.GetType().GetProperty("Pass").GetValue(r),
+                    (string)r.GetType().GetProperty("Message").GetValue(r) }).ToList();
+            }
+            catch (Exception ex)
+            {
+                all[type.Namespace] = "erro: " + (ex.InnerException ?? ex).Message;
+            }
+        }
+        stdout.Write(JsonSerializer.Serialize(all));
+    }
+}
+"""
+
+# Mesmo criterio do CSharpValidator para levar os using para o topo
+_CS_USING = re.compile(r"^using [^(]*;$")
+_CS_ERROR = re.compile(r"(R\d+_\w+)\.cs\(\d+,\d+\): error (\w+: .*?)(?: \[.*\])?$", re.M)
+FORMS = ("expandido", "compacto")
+
+
+def forms(data):
+    """(testCode expandido, prelude + corpo compacto) de um registro com template."""
+    config = data["validatorConfig"]
+    template = templates.get(config["template"])
+    return template.expand(config["tests"]), template.compile(config["tests"])
+
+
+def _compare(data, expanded, compact):
+    """Problemas de um desafio a partir dos resultados das duas formas."""
+    problems = [f"forma {form}: {result}" for form, result in zip(FORMS, (expanded, compact))
+                if isinstance(result, str)]
+    if not problems and expanded != compact:
+        for n, (a, b) in enumerate(zip(expanded, compact), 1):
+            if a != b:
+                problems.append(f"teste {n}: expandido {a} x compacto {b}")
+        if len(expanded) != len(compact):
+            problems.append(f"{len(expanded)} teste(s) no expandido x {len(compact)} no compacto")
+    return {"id": data["id"], "problems": problems, "compared": True}
+
+
+def verify_js(records):
+    node = shutil.which("node")
+    if node is None:
+        return None
+    items = [[data.get("starterCode", ""), *forms(data)] for data in records]
+    proc = subprocess.run([node, "-e", JS_RUNNER], input=json.dumps(items), capture_output=True,
+                          text=True, encoding="utf-8", timeout=TIMEOUT)
+    if proc.returncode != 0:
+        raise RuntimeError(f"node saiu com {proc.returncode}: {proc.stderr.strip()}")
+    return [_compare(data, *pair) for data, pair in zip(records, json.loads(proc.stdout))]
+
+
+def _cs_file(namespace, *parts):
+    usings = {"using System;", "using System.Collections.Generic;", "using System.Linq;", "using System.Text;"}
+    body = []
+    for line in "\n".join(parts).split("\n"):
+        if _CS_USING.match(line.strip()):
+            usings.add(line.strip())
+        else:
+            body.append(line)
+    return "\n".join(sorted(usings)) + f"\n\nnamespace {namespace}\n{{\n" + "\n".join(body) + "\n}\n"
+
+
+def _cs_build(dotnet, env, tmp, records, indexes):
+    """Compila e roda as formas de records[i] para i em indexes. Retorna (resultados, erros de compilacao)."""
+    for name in os.listdir(tmp):
+        if name.startswith("R") and name.endswith(".cs"):
+            os.remove(os.path.join(tmp, name))
+    for i in indexes:
+        for form, code in zip(FORMS, forms(records[i])):
+            with open(os.path.join(tmp, f"R{i}_{form}.cs"), "w", encoding="utf-8") as f:
+                f.write(_cs_file(f"R{i}_{form}", records[i].get("starterCode", ""), code))
+    out = os.path.join(tmp, "bin")
+    build = subprocess.run([dotnet, "build", tmp, "-nologo", "-v", "q", "-clp:NoSummary", "-o", out],
+                           capture_output=True, text=True, encoding="utf-8", env=env, timeout=TIMEOUT)
+    if build.returncode != 0:
+        errors = {}
+        for name, message in _CS_ERROR.findall(build.stdout):
+            i, form = name[1:].split("_", 1)
+            errors.setdefault(int(i), {}).setdefault(form, []).append(message)
+        if not errors:
+            raise RuntimeError(f"dotnet build falhou:\n{build.stdout.strip()}")
+        return None, errors
+    proc = subprocess.run([dotnet, os.path.join(out, "TemplateCheck.dll")], capture_output=True,
+                          text=True, encoding="utf-8", env=env, timeout=TIMEOUT)
+    if proc.returncode != 0:
+        raise RuntimeError(f"TemplateCheck saiu com {proc.returncode}: {proc.stderr.strip()}")
+    return json.loads(proc.stdout), {}
+
+
+def verify_csharp(records):
+    dotnet = shutil.which("dotnet")
+    if dotnet is None:
+        return None
+    env = {**os.environ, "DOTNET_CLI_TELEMETRY_OPTOUT": "1", "DOTNET_NOLOGO": "1"}
+    found = {}
+    with tempfile.TemporaryDirectory(prefix="codegym-templates-") as tmp:
+        with open(os.path.join(tmp, "TemplateCheck.csproj"), "w", encoding="utf-8") as f:
+            f.write(CS_PROJECT)
+        with open(os.path.join(tmp, "TemplateCheck.cs"), "w", encoding="utf-8") as f:
+            f.write(CS_RUNNER)
+        indexes = list(range(len(records)))
+        while True:
+            # Um desafio que nao compila derruba o projeto: sai dele e compila o resto de novo
+            results, errors = _cs_build(dotnet, env, tmp, records, indexes)
+            if results is not None:
+                break
+            for i, by_form in errors.items():
+                expanded, compact = (by_form.get(form, []) for form in FORMS)
+                if expanded == compact:
+                    # Os dois falham igual: e o starter que nao compila (ex.: metodo abstrato a implementar)
+                    found[i] = {"id": records[i]["id"], "problems": [], "compared": False}
+                else:
+                    found[i] = {"id": records[i]["id"], "compared": True,
+                                "problems": [f"forma {form}: {message}" for form in FORMS
+                                             for message in by_form.get(form, [])[:3]]}
+            indexes = [i for i in indexes if i not in errors]
+    missing = "TestRunner nao encontrado"
+    for i in indexes:
+        found[i] = _compare(records[i], *(results.get(f"R{i}_{form}", missing) for form in FORMS))
+    return [found[i] for i in range(len(records))]
+
+
+RUNNERS = {"js-tests": ("node", verify_js), "csharp-tests": ("dotnet", verify_csharp)}
+
+
+def verify_records(records):
+    """
+    Compara as formas dos desafios com template. Retorna (resultados, trilhas
+    puladas): [{"id", "problems"}] na ordem recebida e [(template, runtime)]
+    das que nao tinham runtime.
+    """
+    results, skipped = [], []
+    for name, (runtime, verify) in RUNNERS.items():
+        chosen = [d for d in records if templates.is_templated(d) and d["validatorConfig"]["template"] == name]
+        if not chosen:
+            continue
+        found = verify(chosen)
+        if found is None:
+            skipped.append((name, runtime))
+        else:
+            results.extend(found)
+    return results, skipped
+
+
+def print_report(results, skipped=()):
+    """Imprime divergencias e resumo. Retorna o numero de desafios com problema."""
+    failed = [r for r in results if r["problems"]]
+    for r in failed:
+        print(r["id"])
+        for message in r["problems"]:
+            print(f"  {message}")
+    for name, runtime in skipped:
+        print(f"AVISO: {name} nao verificado ({runtime} nao encontrado no PATH).")
+    compared = sum(r["compared"] for r in results)
+    print(f"Templates: {compared} desafio(s) comparado(s) (expandido x compacto), "
+          f"{len(results) - compared} sem comparacao (starter nao compila), {len(failed)} com problema.")
+    return len(failed)
+
+
+def load_records():
+    """Registros compactos (com template) direto dos geradores de JS e C#."""
+    import generate_csharp
+    import generate_js
+
+    return [data for module in (generate_js, generate_csharp) for data in module.records()]
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Compara o testCode expandido com a forma compacta dos templates.")
+    parser.parse_args(argv)
+
+    start = time.perf_counter()
+    failed = print_report(*verify_records(load_records()))
+    print(f"Tempo: {time.perf_counter() - start:.2f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
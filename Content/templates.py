@@ -0,0 +1,206 @@
+"""
+Registro de templates de validacao.
+
+Os geradores de JS e C# nao embutem mais o wrapper completo em cada desafio:
+emitem so o payload dos testes e uma referencia ao template,
+
+    "validatorConfig": {"template": "js-tests", "tests": [["teq", "soma(2, 3)", "5", "ok", "falhou"], ...]}
+
+Cada template sabe produzir duas formas de codigo:
+
+- expand():  o testCode autocontido de sempre (wrapper + try/catch por
+             teste). E o que vai para os arquivos de challenges/, que o app
+             le hoje.
+- body():    so o corpo compacto, que chama os helpers do prelude. O prelude
+             (usings, TestResult, helpers com o try/catch) e guardado uma vez
+             por pacote, e um runner que conhece o template o compila/parseia
+             uma vez so em vez de uma vez por desafio.
+
+As duas formas tem que dar o mesmo resultado; template_verifier.py (e
+build.py --verify) roda as duas contra o starter de cada desafio e compara.
+
+Passos de teste sao listas [tipo, args...]. Tipos suportados:
+    js-tests:     t, teq, try, raw
+    csharp-tests: eq, eqs, check, raw
+"""
+import re
+from abc import ABC, abstractmethod
+
+_JS_CATCH = "catch(e) { results.push({ pass: false, message: 'Erro: ' + e.message }); }"
+_CS_CATCH = 'catch (Exception ex) { results.Add(new TestResult { Pass = false, Message = "Erro: " + ex.Message }); }'
+_JS_TRY = re.compile(r"^    try \{ (.*) \} " + re.escape(_JS_CATCH) + "$")
+
+
+def _js_str(text):
+    """Conteudo de uma string JS entre aspas simples."""
+    return text.replace("\\", "\\\\").replace("'", "\\'")
+
+
+def _cs_str(text):
+    """Conteudo de uma string C# entre aspas duplas."""
+    return text.replace("\\", "\\\\").replace('"', '\\"')
+
+
+class Template(ABC):
+    """Interface de um template. Subclasses definem name, prelude e os passos."""
+
+    name = ""
+    prelude = ""
+
+    @abstractmethod
+    def expand(self, tests):
+        """testCode autocontido."""
+
+    @abstractmethod
+    def body(self, tests):
+        """Corpo compacto, que depende do prelude."""
+
+    def compile(self, tests):
+        """Codigo executavel da forma compacta: prelude + corpo."""
+        return f"{self.prelude}\n\n{self.body(tests)}"
+
+
+class JsTests(Template):
+    name = "js-tests"
+    prelude = (
+        "function __t(results, fn, ok, fail) { try { const r = fn(); results.push({ pass: !!r, message: r ? ok : fail }); } " + _JS_CATCH + " }\n"
+        "function __teq(results, fn, exp, ok, fail) { try { const r = fn(); const pass = JSON.stringify(r) === JSON.stringify(exp); "
+        "results.push({ pass, message: pass ? ok : fail + ': esperado ' + JSON.stringify(exp) + ' obteve ' + JSON.stringify(r) }); } " + _JS_CATCH + " }\n"
+        "function __try(results, fn) { try { fn(); } " + _JS_CATCH + " }"
+    )
+
+    @staticmethod
+    def step(code):
+        """Converte uma linha "try { ... } catch" escrita a mao em passo estruturado."""
+        m = _JS_TRY.match(code)
+        return ["try", m.group(1)] if m else ["raw", code]
+
+    def expand(self, tests):
+        lines = []
+        for kind, *args in tests:
+            if kind == "t":
+                expr, ok, fail = args
+                lines.append(f"    try {{ const r = {expr}; results.push({{ pass: !!r, message: r ? '{_js_str(ok)}' : '{_js_str(fail)}' }}); }} {_JS_CATCH}")
+            elif kind == "teq":
+                expr, exp_s, ok, fail = args
+                lines.append(f"    try {{ const r = {expr}; const exp = {exp_s}; const pass = JSON.stringify(r) === JSON.stringify(exp); "
+                             f"results.push({{ pass, message: pass ? '{_js_str(ok)}' : '{_js_str(fail)}: esperado ' + JSON.stringify(exp) + ' obteve ' + JSON.stringify(r) }}); }} {_JS_CATCH}")
+            elif kind == "try":
+                lines.append(f"    try {{ {args[0]} }} {_JS_CATCH}")
+            else:
+                lines.append(args[0])
+        return self._wrap("\n".join(lines))
+
+    def body(self, tests):
+        lines = []
+        for kind, *args in tests:
+            if kind == "t":
+                expr, ok, fail = args
+                lines.append(f"    __t(results, () => ({expr}), '{_js_str(ok)}', '{_js_str(fail)}');")
+            elif kind == "teq":
+                expr, exp_s, ok, fail = args
+                lines.append(f"    __teq(results, () => ({expr}), {exp_s}, '{_js_str(ok)}', '{_js_str(fail)}');")
+            elif kind == "try":
+                lines.append(f"    __try(results, () => {{ {args[0]} }});")
+            else:
+                lines.append(args[0])
+        return self._wrap("\n".join(lines))
+
+    @staticmethod
+    def _wrap(code):
+        return f"function __runTests() {{\n    const results = [];\n{code}\n    return results;\n}}"
+
+
+class CSharpTests(Template):
+    name = "csharp-tests"
+    result_class = "public class TestResult { public bool Pass { get; set; } public string Message { get; set; } }"
+    usings = "using System;\nusing System.Collections.Generic;\nusing System.Linq;"
+    prelude = (
+        f"{usings}\n\n{result_class}\n\n"
+        "public static class TestKit\n"
+        "{\n"
+        "    public static void Eq(List<TestResult> results, Func<(bool Pass, object Value)> fn, string ok, string fail)\n"
+        "    {\n"
+        "        try { var (p, r) = fn(); results.Add(new TestResult { Pass = p, Message = p ? ok : fail + \": \" + r }); } " + _CS_CATCH + "\n"
+        "    }\n\n"
+        "    public static void Check(List<TestResult> results, Func<bool> fn, string ok, string fail)\n"
+        "    {\n"
+        "        try { bool p = fn(); results.Add(new TestResult { Pass = p, Message = p ? ok : fail }); } " + _CS_CATCH + "\n"
+        "    }\n"
+        "}"
+    )
+
+    def expand(self, tests):
+        lines = []
+        for kind, *args in tests:
+            if kind in ("eq", "eqs"):
+                expr, expected, ok, fail = args
+                if kind == "eqs":
+                    expected = f'"{_cs_str(expected)}"'
+                lines.append(f'        try {{ var r = {expr}; bool p = r == {expected}; results.Add(new TestResult {{ Pass = p, Message = p ? "{_cs_str(ok)}" : "{_cs_str(fail)}: " + r }}); }} {_CS_CATCH}')
+            elif kind == "check":
+                expr, ok, fail = args
+                if expr.startswith("{"):
+                    # Bloco com return: so vale como corpo de lambda, como no TestKit.Check
+                    expr = f"new Func<bool>(() => {expr})()"
+                lines.append(f'        try {{ bool p = {expr}; results.Add(new TestResult {{ Pass = p, Message = p ? "{_cs_str(ok)}" : "{_cs_str(fail)}" }}); }} {_CS_CATCH}')
+            else:
+                lines.append(args[0])
+        return f"{self.usings}\n\n{self._runner(chr(10).join(lines))}\n\n{self.result_class}"
+
+    def body(self, tests):
+        lines = []
+        for kind, *args in tests:
+            if kind in ("eq", "eqs"):
+                expr, expected, ok, fail = args
+                if kind == "eqs":
+                    expected = f'"{_cs_str(expected)}"'
+                lines.append(f'        TestKit.Eq(results, () => {{ var r = {expr}; return (r == {expected}, r); }}, "{_cs_str(ok)}", "{_cs_str(fail)}");')
+            elif kind == "check":
+                expr, ok, fail = args
+                lines.append(f'        TestKit.Check(results, () => {expr}, "{_cs_str(ok)}", "{_cs_str(fail)}");')
+            else:
+                lines.append(args[0])
+        return self._runner("\n".join(lines))
+
+    @staticmethod
+    def _runner(code):
+        return ("public class TestRunner\n{\n    public static List<TestResult> RunTests()\n    {\n"
+                f"        var results = new List<TestResult>();\n{code}\n        return results;\n    }}\n}}")
+
+
+TEMPLATES = {}
+
+
+def register(template):
+    TEMPLATES[template.name] = template
+    return template
+
+
+register(JsTests())
+register(CSharpTests())
+
+
+def get(name):
+    try:
+        return TEMPLATES[name]
+    except KeyError:
+        raise KeyError(f"Template de validacao desconhecido: {name}") from None
+
+
+def is_templated(data):
+    return "template" in data.get("validatorConfig", {})
+
+
+def expand(data):
+    """Registro com testCode autocontido (formato lido pelo app hoje)."""
+    if not is_templated(data):
+        return data
+    config = data["validatorConfig"]
+    return {**data, "validatorConfig": {"testCode": get(config["template"]).expand(config["tests"])}}
+
+
+def preludes(records):
+    """{nome: prelude} dos templates usados pelos registros, para guardar uma vez no pacote."""
+    names = sorted({r["validatorConfig"]["template"] for r in records if is_templated(r)})
+    return {name: get(name).prelude for name in names}
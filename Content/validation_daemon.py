@@ -0,0 +1,312 @@
+"""
+Daemon local de validacao, sempre quente.
+
+Carrega os desafios uma vez, pre-compila os seletores das regras HTML em
+cada worker e fica ouvindo em localhost (TCP) ou num socket Unix. Cada
+pedido e uma linha JSON; cada resposta tambem:
+
+    {"op": "validate", "items": [{"id": "html-ini-001", "code": "<!DOCTYPE html>..."}, ...]}
+    -> {"ok": true, "results": [{"id", "status", "aprovadas", "total", "detalhes"}, ...]}
+
+    {"op": "stats"}
+    -> {"ok": true, "workers", "queue", "requests", "items", "latency_ms": {"p50", "p90", "p99", "max"}}
+
+    {"op": "ping"} -> {"ok": true}
+
+Os itens de um pedido sao divididos em lotes entre os workers do pool; a
+avaliacao e a mesma do bulk_grader.py (mesmos status e --executor). queue
+conta os itens aceitos e ainda nao respondidos; as latencias sao de pedido
+inteiro (recebido -> respondido), sobre os ultimos LATENCY_WINDOW pedidos.
+
+Uso:
+    python validation_daemon.py serve                    # 127.0.0.1:8765
+    python validation_daemon.py serve --socket /tmp/codegym.sock --jobs 4 --executor js-tests=node
+    python validation_daemon.py stats
+    python validation_daemon.py validate html-ini-001 pagina.html
+
+O daemon nao tem autenticacao e os executores rodam o codigo recebido, entao
+serve so aceita --host de loopback; outro endereco exige --allow-remote.
+"""
+import collections
+import ipaddress
+import json
+import math
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import bulk_grader
+import rule_verifier
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+HOST = "127.0.0.1"
+PORT = 8765
+LATENCY_WINDOW = 1000
+MAX_LINE = 16 * 2 ** 20
+
+
+# ===================== WORKER =====================
+
+def _init(challenge_paths, executor_specs):
+    """Desafios e executores (como no bulk_grader) + seletores ja parseados."""
+    bulk_grader._init(challenge_paths, executor_specs)
+    for data in bulk_grader._challenges.values():
+        if data.get("validatorType") == "html-rules":
+            for rule in data["validatorConfig"].get("rules") or []:
+                try:
+                    rule_verifier.parse_selector(rule.get("selector") or "")
+                except ValueError:
+                    pass  # o erro volta na avaliacao, como no app
+
+
+def _check_batch(items):
+    return [{"id": cid, **bulk_grader.check(cid, code)} for cid, code in items]
+
+
+# ===================== SERVIDOR =====================
+
+def _percentile(ordered, p):
+    if not ordered:
+        return 0.0
+    # nearest-rank
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+class Validator:
+    """Pool de workers + contadores. Thread-safe: cada conexao roda na sua thread."""
+
+    def __init__(self, challenge_paths, executor_specs, jobs=0):
+        self.workers = jobs or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init,
+                                        initargs=(challenge_paths, executor_specs))
+        # Sobe os workers ja (e falha aqui se os desafios ou executores nao carregarem)
+        list(self.pool.map(_check_batch, [[]] * self.workers))
+        self.lock = threading.Lock()
+        self.queue = 0
+        self.requests = 0
+        self.items = 0
+        self.latencies = collections.deque(maxlen=LATENCY_WINDOW)
+
+    def validate(self, items, start):
+        pairs = [(str(item.get("id", "")), str(item.get("code", ""))) for item in items]
+        with self.lock:
+            self.queue += len(pairs)
+        try:
+            size = max(1, -(-len(pairs) // self.workers))
+            futures = [self.pool.submit(_check_batch, pairs[i:i + size]) for i in range(0, len(pairs), size)]
+            return [r for future in futures for r in future.result()]
+        finally:
+            with self.lock:
+                self.queue -= len(pairs)
+                self.requests += 1
+                self.items += len(pairs)
+                self.latencies.append((time.perf_counter() - start) * 1000)
+
+    def stats(self):
+        with self.lock:
+            ordered = sorted(self.latencies)
+            latency = {f"p{p}": round(_percentile(ordered, p), 2) for p in (50, 90, 99)}
+            latency["max"] = round(ordered[-1], 2) if ordered else 0.0
+            return {"workers": self.workers, "queue": self.queue, "requests": self.requests, "items": self.items,
+                    "latency_ms": latency}
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            line = self.rfile.readline(MAX_LINE)
+            if not line:
+                return
+            if not line.endswith(b"\n") and len(line) >= MAX_LINE:
+                self.wfile.write(b'{"ok": false, "error": "pedido maior que o limite"}\n')
+                return
+            start = time.perf_counter()
+            try:
+                response = self.server.dispatch(json.loads(line), start)
+            except Exception as ex:
+                response = {"ok": False, "error": f"{type(ex).__name__}: {ex}"}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _Server:
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def dispatch(self, request, start):
+        op = request.get("op")
+        if op == "validate":
+            return {"ok": True, "results": self.validator.validate(request.get("items") or [], start)}
+        if op == "stats":
+            return {"ok": True, **self.validator.stats()}
+        if op == "ping":
+            return {"ok": True}
+        return {"ok": False, "error": f"op desconhecida: {op}"}
+
+
+class TcpServer(_Server, socketserver.ThreadingTCPServer):
+    pass
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class UnixServer(_Server, socketserver.ThreadingUnixStreamServer):
+        pass
+
+
+def is_loopback(host):
+    """True se host so e alcancavel da propria maquina (localhost, 127.x, ::1)."""
+    try:
+        infos = socket.getaddrinfo(host, None)
+    except socket.gaierror:
+        return False
+    return all(ipaddress.ip_address(info[4][0].split("%")[0]).is_loopback for info in infos)
+
+
+def remove_stale_socket(path):
+    """Apaga um socket Unix antigo em path; qualquer outro arquivo e um erro."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} existe e nao e um socket; escolha outro --socket.")
+    os.unlink(path)
+
+
+def serve(validator, host=HOST, port=PORT, socket_path=None):
+    if socket_path:
+        remove_stale_socket(socket_path)
+        server = UnixServer(socket_path, _Handler)
+        where = socket_path
+    else:
+        server = TcpServer((host, port), _Handler)
+        where = f"{host}:{server.server_address[1]}"
+    server.validator = validator
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)  # gerenciadores de servico encerram com SIGTERM
+    print(f"Validando em {where} com {validator.workers} worker(s). Ctrl+C encerra.", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        validator.close()
+        if socket_path and os.path.exists(socket_path) and stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+            os.unlink(socket_path)
+
+
+# ===================== CLIENTE =====================
+
+class ValidationClient:
+    """
+    Conexao persistente com o daemon (editores, bulk grader, scripts).
+
+        with ValidationClient() as client:
+            client.validate([("html-ini-001", codigo)])
+    """
+
+    def __init__(self, host=HOST, port=PORT, socket_path=None, timeout=60):
+        if socket_path:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(socket_path)
+        else:
+            self.sock = socket.create_connection((host, port))
+        self.sock.settimeout(timeout)
+        self.file = self.sock.makefile("rwb")
+
+    def request(self, payload):
+        self.file.write(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("Daemon fechou a conexao.")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise RuntimeError(response.get("error", "erro no daemon"))
+        return response
+
+    def validate(self, items):
+        """items: [(id, codigo)] -> resultados na mesma ordem."""
+        return self.request({"op": "validate", "items": [{"id": cid, "code": code} for cid, code in items]})["results"]
+
+    def stats(self):
+        return self.request({"op": "stats"})
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Daemon local de validacao (pool quente de workers).")
+    parser.add_argument("--host", default=HOST, help=f"endereco TCP (padrao: {HOST}; so loopback sem --allow-remote)")
+    parser.add_argument("--port", type=int, default=PORT, help=f"porta TCP (padrao: {PORT})")
+    parser.add_argument("--socket", metavar="PATH", help="usa um socket Unix em vez de TCP")
+    parser.add_argument("--allow-remote", action="store_true",
+                        help="aceita --host fora do loopback: sem autenticacao, qualquer um na rede "
+                             "manda codigo para os executores")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_serve = sub.add_parser("serve", help="sobe o daemon")
+    p_serve.add_argument("--challenges", action="append", metavar="PATH",
+                         help="arquivos ou pastas de desafios (padrao: challenges/; pode repetir)")
+    p_serve.add_argument("--executor", action="append", type=bulk_grader.parse_executor, default=[],
+                         metavar="TIPO=EXECUTOR", help="executor de js-tests/csharp-tests (ver bulk_grader.py)")
+    p_serve.add_argument("--jobs", type=int, default=0, help="workers (0 = numero de CPUs, padrao)")
+    sub.add_parser("stats", help="fila e latencias do daemon")
+    p_check = sub.add_parser("validate", help="valida um arquivo contra um desafio")
+    p_check.add_argument("id", help="id do desafio")
+    p_check.add_argument("file", help="arquivo com o codigo")
+    args = parser.parse_args(argv)
+
+    if args.socket and not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        parser.error("--socket precisa de sockets Unix, que este sistema nao tem; use --host/--port")
+    if args.command == "serve" and not args.socket and not is_loopback(args.host):
+        if not args.allow_remote:
+            parser.error(f"--host {args.host} nao e loopback: o daemon nao tem autenticacao e os executores "
+                         "rodam o codigo recebido. Use --allow-remote para aceitar mesmo assim.")
+        print(f"AVISO: escutando em {args.host} sem autenticacao; qualquer um que alcance a porta "
+              "executa codigo nesta maquina.", file=sys.stderr)
+    if args.command == "serve":
+        if args.socket:
+            try:
+                remove_stale_socket(args.socket)
+            except FileExistsError as ex:
+                parser.error(str(ex))
+        validator = Validator(args.challenges or [os.path.join(ROOT, "challenges")], dict(args.executor), args.jobs)
+        serve(validator, args.host, args.port, args.socket)
+        return 0
+    with ValidationClient(args.host, args.port, args.socket) as client:
+        if args.command == "stats":
+            print(json.dumps(client.stats(), ensure_ascii=False, indent=2))
+            return 0
+        with open(args.file, "r", encoding="utf-8-sig") as f:
+            result = client.validate([(args.id, f.read())])[0]
+    print(f"{result['id']}: {result['status']} ({result['aprovadas']}/{result['total']})")
+    for detail in result["detalhes"]:
+        print(f"  [{'ok' if detail['passou'] else 'x '}] {detail['nome']}: {detail['mensagem']}")
+    return 0 if result["status"] == "passou" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""
+Benchmark e regressao de pixels do generate_icon.py.
+
+Roda o pipeline do icone fase por fase (master, blur/composite, resizes,
+encode PNG, montagem do ICO), mede o tempo de cada uma e o pico de memoria
+Python (tracemalloc), e compara cada tamanho gerado com as imagens de
+referencia, com limites de erro maximo/medio por tamanho.
+
+As referencias sao os arquivos versionados: cada entrada de icon.ico mais
+icon_hd.png (1024). Eles foram gerados com as fontes do Windows; em outra
+maquina, aponte --golden para uma pasta gerada la mesmo
+(python generate_icon.py --out DIR --no-cache).
+
+Uso:
+    python bench_icon.py                       # 3 rodadas, modo direto
+    python bench_icon.py --pyramid --repeat 5
+    python bench_icon.py --profile compact
+    python bench_icon.py --supersample 4       # limites de ANALYTIC_THRESHOLDS
+    python bench_icon.py --supersample 2 --threshold 16=255,12
+    python bench_icon.py --strict              # exige pixels identicos
+    python bench_icon.py --golden /tmp/ref/src/CodeGym.UI/Resources
+
+Sai com codigo 1 se algum tamanho passar do limite.
+"""
+import io
+import math
+import os
+import statistics
+import struct
+import sys
+import time
+import tracemalloc
+
+from PIL import Image, ImageChops, ImageStat
+
+import generate_icon as gi
+
+try:
+    import resource
+except ImportError:  # Windows: sem ru_maxrss
+    resource = None
+
+PHASES = ("master", "blur/composite", "resize", "encode", "ico")
+SIZES = sorted(set(gi.ICO_SIZES + [1024]))
+
+# {tamanho: (erro maximo por canal, erro medio)} em RGBa (alpha pre-multiplicado).
+# Folga suficiente para --pyramid.
+THRESHOLDS = {16: (32, 1.0), 20: (32, 1.0), 24: (32, 1.0), 32: (32, 1.0), 40: (32, 1.0), 48: (32, 1.0),
+              64: (16, 0.25), 128: (16, 0.25), 256: (16, 0.25), 1024: (8, 0.1)}
+# --supersample 4 ou mais: o desenho em 4x nao e o master reduzido (bordas sem
+# anti-aliasing, dica da fonte), mas a geometria tem que bater. Medido em x4
+# com folga de ~10%; fator menor pede --threshold.
+ANALYTIC_THRESHOLDS = {16: (96, 3.5), 20: (104, 3.0), 24: (104, 3.0), 32: (104, 1.5), 40: (112, 2.0),
+                       48: (112, 1.5), 64: (64, 0.75), 128: (72, 0.4), 256: (56, 0.2), 1024: (8, 0.1)}
+
+
+class PhaseTimer:
+    """Acumula tempo e pico de tracemalloc por fase."""
+
+    def __init__(self):
+        self.times = {phase: 0.0 for phase in PHASES}
+        self.peaks = {phase: 0 for phase in PHASES}
+
+    def run(self, phase, fn, *args, **kwargs):
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.times[phase] += time.perf_counter() - start
+            self.peaks[phase] = max(self.peaks[phase], tracemalloc.get_traced_memory()[1])
+
+
+def run_pipeline(timer, mode="direct", supersample=None, font_path=None, profile="default"):
+    """Uma rodada completa, sem cache. Retorna ({tamanho: imagem final}, bytes do ICO)."""
+    # blur/composite roda dentro do master: o tempo dele e descontado do master
+    original = gi.composite_blurred
+    blur = [0.0]
+
+    def timed_blur(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            blur[0] += time.perf_counter() - start
+
+    gi.composite_blurred = timed_blur
+    try:
+        if supersample:
+            resized = timer.run("resize", lambda: {sz: gi.render_analytic(sz, supersample, font_path) for sz in SIZES})
+        else:
+            master = timer.run("master", gi.create_master, font_path=font_path)
+            resized = timer.run("resize", gi.render_sizes, master, SIZES, pyramid=(mode == "pyramid"))
+    finally:
+        gi.composite_blurred = original
+    phase = "resize" if supersample else "master"
+    timer.times[phase] -= blur[0]
+    timer.times["blur/composite"] += blur[0]
+
+    final = timer.run("resize", lambda: {sz: gi.finish(img, sz) for sz, img in resized.items()})
+    blobs = timer.run("encode", lambda: {sz: gi.encode_png(img.convert("RGBA"), profile) for sz, img in final.items()})
+    ico = timer.run("ico", gi.ico_bytes, {sz: blobs[sz] for sz in gi.ICO_SIZES})
+    return final, ico
+
+
+def ico_entries(data):
+    """{tamanho: imagem} das entradas PNG de um ICO."""
+    _, kind, count = struct.unpack_from("<HHH", data, 0)
+    if kind != 1:
+        raise ValueError("Arquivo nao e um ICO.")
+    images = {}
+    for i in range(count):
+        w, _, _, _, _, _, length, offset = struct.unpack_from("<BBBBHHII", data, 6 + 16 * i)
+        img = Image.open(io.BytesIO(data[offset:offset + length]))
+        images[w or 256] = img.convert("RGBA")
+    return images
+
+
+def load_golden(folder):
+    """Referencias: entradas do icon.ico + icon_hd.png."""
+    with open(os.path.join(folder, "icon.ico"), "rb") as f:
+        golden = ico_entries(f.read())
+    hd = os.path.join(folder, "icon_hd.png")
+    if os.path.exists(hd):
+        golden[1024] = Image.open(hd).convert("RGBA")
+    return golden
+
+
+def pixel_diff(img, ref):
+    """(erro maximo por canal, erro medio, PSNR) em RGBa."""
+    diff = ImageChops.difference(img.convert("RGBa"), ref.convert("RGBa"))
+    max_err = max(hi for _, hi in diff.getextrema())
+    stat = ImageStat.Stat(diff)
+    mean = sum(stat.mean) / len(stat.mean)
+    mse = sum(stat.sum2) / (len(stat.sum2) * img.width * img.height)
+    psnr = float("inf") if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+    return max_err, mean, psnr
+
+
+def parse_threshold(text):
+    """'16=255,8' -> (16, (255, 8.0))."""
+    size, _, limits = text.partition("=")
+    max_err, _, mean = limits.partition(",")
+    return int(size), (int(max_err), float(mean or "inf"))
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark e regressao de pixels do generate_icon.py.")
+    parser.add_argument("--repeat", type=int, default=3, help="rodadas (padrao: 3)")
+    parser.add_argument("--pyramid", action="store_true", help="mede o modo --pyramid")
+    parser.add_argument("--supersample", type=int, metavar="N", help="mede o modo --supersample N")
+    parser.add_argument("--profile", choices=sorted(gi.ENCODE_PROFILES), default="default",
+                        help="perfil de codificacao PNG medido")
+    parser.add_argument("--golden", default=os.path.join(gi.ROOT, "src", "CodeGym.UI", "Resources"),
+                        help="pasta com icon.ico/icon_hd.png de referencia (padrao: Resources versionado)")
+    parser.add_argument("--threshold", action="append", type=parse_threshold, default=[], metavar="SIZE=MAX,MEAN",
+                        help="sobrescreve o limite de um tamanho (pode repetir)")
+    parser.add_argument("--strict", action="store_true", help="exige pixels identicos em todos os tamanhos")
+    args = parser.parse_args(argv)
+
+    mode = "pyramid" if args.pyramid else "direct"
+    font_path = gi.resolve_font()
+    if args.strict:
+        thresholds = {sz: (0, 0.0) for sz in SIZES}
+    else:
+        thresholds = dict(ANALYTIC_THRESHOLDS if args.supersample else THRESHOLDS)
+    thresholds.update(args.threshold)
+
+    tracemalloc.start()
+    rounds = []
+    for _ in range(args.repeat):
+        timer = PhaseTimer()
+        final, ico = run_pipeline(timer, mode, args.supersample, font_path, args.profile)
+        rounds.append(timer)
+    tracemalloc.stop()
+
+    label = f"analytic x{args.supersample}" if args.supersample else mode
+    print(f"Modo {label}, perfil {args.profile}, {args.repeat} rodada(s)")
+    print(f"{'fase':<16} {'min(ms)':>9} {'mediana':>9} {'pico py(MB)':>12}")
+    for phase in PHASES:
+        times = [r.times[phase] * 1000 for r in rounds]
+        peak = max(r.peaks[phase] for r in rounds) / 2 ** 20
+        print(f"{phase:<16} {min(times):>9.1f} {statistics.median(times):>9.1f} {peak:>12.2f}")
+    total = [sum(r.times.values()) * 1000 for r in rounds]
+    print(f"{'total':<16} {min(total):>9.1f} {statistics.median(total):>9.1f}")
+    if resource is not None:
+        # tracemalloc so ve alocacoes Python; os buffers do Pillow aparecem no RSS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f"pico RSS do processo: {rss / (1024 if sys.platform != 'darwin' else 2 ** 20):.1f} MB")
+    print(f"ICO: {len(ico):,} bytes")
+
+    golden = load_golden(args.golden)
+    failed = []
+    print(f"\n{'size':>6} {'max':>5} {'mean':>8} {'psnr(dB)':>9} {'limite':>12}")
+    for sz in SIZES:
+        if sz not in golden:
+            print(f"{sz:>6} {'sem referencia':>36}")
+            continue
+        max_err, mean, psnr = pixel_diff(final[sz], golden[sz])
+        limit_max, limit_mean = thresholds[sz]
+        ok = max_err <= limit_max and mean <= limit_mean
+        if not ok:
+            failed.append(sz)
+        print(f"{sz:>6} {max_err:>5} {mean:>8.4f} {psnr:>9.2f} {f'{limit_max}/{limit_mean:g}':>12}"
+              f"{'' if ok else '  FALHOU'}")
+
+    if failed:
+        print(f"\nFora do limite: {', '.join(map(str, failed))}")
+        return 1
+    print("\nTodos os tamanhos dentro do limite.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
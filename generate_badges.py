@@ -0,0 +1,231 @@
+"""
+Gera as imagens de badge das conquistas a partir da arte do icone.
+
+Cada badge e uma variacao do icone: quadrado arredondado na cor da categoria,
+glifo no centro (no lugar do "CG") e circulo de status no canto (check verde
+para desbloqueada, barra cinza para bloqueada).
+
+As camadas que nao mudam entre variantes (mascara do fundo, gradiente, sombra
+desfocada do circulo, mascaras do circulo, check, barra e o glifo com sua
+sombra) sao calculadas uma vez so no processo principal e enviadas uma vez
+para cada worker; cada variante so pinta a cor e empilha as camadas prontas.
+
+Uso:
+    python generate_badges.py              # uma badge por conquista x estado
+    python generate_badges.py --matrix     # todas as cores x glifos x estados
+    python generate_badges.py --size 128 --out /tmp/badges
+"""
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+import os
+
+from generate_icon import (ICON_PARAMS, ROOT, draw_check, draw_circle_shadow, draw_text_shadow, encode_png,
+                           gradient_layer, resolve_font, status_geometry, text_origin, write_if_changed)
+
+# Cor do fundo por categoria (mesmas categorias do AchievementService)
+PALETTE = {
+    "consistencia": (234, 88, 12),
+    "maestria": (124, 58, 237),
+    "velocidade": (14, 165, 233),
+    "explorador": (22, 163, 74),
+}
+
+# (id, glifo, categoria) — espelha src/CodeGym.UI/Services/AchievementService.cs.
+# Os icones do app sao emoji; aqui o glifo e texto, que a fonte do icone desenha.
+ACHIEVEMENTS = [
+    ("first-step", "1", "consistencia"),
+    ("streak-3", "3", "consistencia"),
+    ("streak-7", "7", "consistencia"),
+    ("streak-30", "30", "consistencia"),
+    ("html-master", "<>", "maestria"),
+    ("css-master", "CSS", "maestria"),
+    ("js-master", "JS", "maestria"),
+    ("csharp-master", "C#", "maestria"),
+    ("speed-demon", "2m", "velocidade"),
+    ("ten-streak", "10", "velocidade"),
+    ("no-errors", "0", "velocidade"),
+    ("explorer-10", "10", "explorador"),
+    ("explorer-25", "25", "explorador"),
+    ("explorer-50", "50", "explorador"),
+    ("all-tracks", "FS", "explorador"),
+    ("note-taker", "Aa", "explorador"),
+]
+
+STATES = ("unlocked", "locked")
+LOCKED_GRAY = (100, 116, 139)
+LOCKED_MIX = 0.65      # quanto do cinza entra na cor de uma badge bloqueada
+LOCKED_GLYPH_ALPHA = 150
+GLYPH_MAX_WIDTH = 0.70  # fracao do lado; glifos longos diminuem a fonte
+
+_layers = None  # camadas compartilhadas, preenchidas por _init em cada worker
+
+
+def _crop(img):
+    """(recorte, (x, y)): a camada guardada so ocupa a area desenhada."""
+    bbox = (img.getchannel("A") if img.mode == "RGBA" else img).getbbox() or (0, 0, 1, 1)
+    return img.crop(bbox), bbox[:2]
+
+
+def _over(img, layer):
+    part, dest = layer
+    img.alpha_composite(part, dest=dest)
+
+
+def _fill(img, color, layer):
+    """Pinta color em img atraves da mascara (L) recortada."""
+    mask, (x, y) = layer
+    img.paste(color, box=(x, y, x + mask.width, y + mask.height), mask=mask)
+
+
+def _font(font_path, size):
+    if font_path:
+        return ImageFont.truetype(font_path, size)
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:  # Pillow < 10.1 nao escala a fonte padrao
+        return ImageFont.load_default()
+
+
+def glyph_layers(s, glyph, font_path, params=ICON_PARAMS):
+    """(sombra desfocada, texto branco) do glifo, centralizado como o "CG" do icone."""
+    k = s / params["size"]
+    font_size = int(s * params["font_size"])
+    font = _font(font_path, font_size)
+    probe = ImageDraw.Draw(Image.new("L", (1, 1)))
+    bbox = probe.textbbox((0, 0), glyph, font=font)
+    if bbox[2] - bbox[0] > s * GLYPH_MAX_WIDTH:
+        font = _font(font_path, int(font_size * s * GLYPH_MAX_WIDTH / (bbox[2] - bbox[0])))
+    tx, ty = text_origin(probe, glyph, font, s, params)
+
+    shadow = Image.new("RGBA", (s, s), (0, 0, 0, 0))
+    draw_text_shadow(shadow, (tx, ty), glyph, font, k, params)
+
+    text = Image.new("RGBA", (s, s), (0, 0, 0, 0))
+    ImageDraw.Draw(text).text((tx, ty), glyph, fill=(255, 255, 255, 255), font=font)
+    return _crop(shadow), _crop(text)
+
+
+def shared_layers(s, glyphs, font_path=None, params=ICON_PARAMS):
+    """Todas as camadas que nao dependem da cor nem do estado, em s x s."""
+    k = s / params["size"]
+    layers = {"size": s}
+
+    # Fundo: mascara do quadrado arredondado + gradiente ja recortado por ela
+    mask = Image.new("L", (s, s), 0)
+    ImageDraw.Draw(mask).rounded_rectangle([(0, 0), (s - 1, s - 1)], radius=int(s * params["corner_radius"]), fill=255)
+    shade = Image.new("RGBA", (s, s), (0, 0, 0, 0))
+    shade.alpha_composite(gradient_layer(s, s - s // 2), dest=(0, s // 2))
+    shade.putalpha(ImageChops.multiply(shade.getchannel("A"), mask))
+    layers["mask"] = _crop(mask)
+    layers["shade"] = _crop(shade)
+
+    # Circulo de status: sombra desfocada, anel branco e mascara do miolo
+    geometry = status_geometry(s, params)
+    circle_shadow = Image.new("RGBA", (s, s), (0, 0, 0, 0))
+    draw_circle_shadow(circle_shadow, geometry, k, params)
+    ring = Image.new("RGBA", (s, s), (0, 0, 0, 0))
+    ImageDraw.Draw(ring).ellipse(geometry["ring"], fill=(255, 255, 255))
+    dot = Image.new("L", (s, s), 0)
+    ImageDraw.Draw(dot).ellipse(geometry["dot"], fill=255)
+    layers["circle_shadow"] = _crop(circle_shadow)
+    layers["ring"] = _crop(ring)
+    layers["dot"] = _crop(dot)
+
+    # Marcas do status: check (desbloqueada) e barra (bloqueada)
+    check = Image.new("RGBA", (s, s), (0, 0, 0, 0))
+    draw_check(ImageDraw.Draw(check), geometry)
+    (ccx, ccy), scale, r = geometry["center"], geometry["scale"], geometry["cap"]
+    bar = Image.new("RGBA", (s, s), (0, 0, 0, 0))
+    ImageDraw.Draw(bar).rounded_rectangle([(ccx - scale, ccy - r), (ccx + scale, ccy + r)], radius=r, fill=(255, 255, 255))
+    layers["check"] = _crop(check)
+    layers["bar"] = _crop(bar)
+
+    layers["glyphs"] = {glyph: glyph_layers(s, glyph, font_path, params) for glyph in sorted(set(glyphs))}
+    return layers
+
+
+def locked_color(color):
+    return tuple(round(c + (g - c) * LOCKED_MIX) for c, g in zip(color, LOCKED_GRAY))
+
+
+def render_badge(layers, color, glyph, state, size):
+    """Badge pronta (RGBA, size x size) a partir das camadas compartilhadas."""
+    s = layers["size"]
+    locked = state == "locked"
+    img = Image.new("RGBA", (s, s), (0, 0, 0, 0))
+    _fill(img, locked_color(color) if locked else color, layers["mask"])
+    _over(img, layers["shade"])
+
+    shadow, (text, dest) = layers["glyphs"][glyph]
+    _over(img, shadow)
+    if locked:
+        text = text.copy()
+        text.putalpha(text.getchannel("A").point(lambda a: a * LOCKED_GLYPH_ALPHA // 255))
+    _over(img, (text, dest))
+
+    _over(img, layers["circle_shadow"])
+    _over(img, layers["ring"])
+    _fill(img, LOCKED_GRAY if locked else tuple(ICON_PARAMS["check_color"]), layers["dot"])
+    _over(img, layers["bar"] if locked else layers["check"])
+    return img if s == size else img.resize((size, size), Image.LANCZOS)
+
+
+def _init(layers):
+    global _layers
+    _layers = layers
+
+
+def _render_job(job):
+    name, color, glyph, state, size = job
+    return name, encode_png(render_badge(_layers, color, glyph, state, size))
+
+
+def badge_jobs(size, matrix=False):
+    """[(nome do arquivo, cor, glifo, estado, tamanho)] das variantes a renderizar."""
+    if not matrix:
+        return [(f"{aid}-{state}.png", PALETTE[category], glyph, state, size)
+                for aid, glyph, category in ACHIEVEMENTS for state in STATES]
+    glyphs = sorted({glyph for _, glyph, _ in ACHIEVEMENTS})
+    return [(f"{cname}-{_slug(glyph)}-{state}.png", color, glyph, state, size)
+            for cname, color in PALETTE.items() for glyph in glyphs for state in STATES]
+
+
+def _slug(glyph):
+    return "".join(c if c.isalnum() else f"x{ord(c):02x}" for c in glyph).lower()
+
+
+def render_badges(jobs, supersample=4, workers=None, font_path=None):
+    """{nome: bytes do PNG}. As camadas sao montadas uma vez e vao para cada worker no initializer."""
+    size = jobs[0][4]
+    layers = shared_layers(size * supersample, [job[2] for job in jobs], font_path)
+    if workers == 1:
+        _init(layers)
+        return dict(map(_render_job, jobs))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init, initargs=(layers,)) as pool:
+        return dict(pool.map(_render_job, jobs, chunksize=max(1, len(jobs) // (4 * (os.cpu_count() or 1)))))
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gera as badges das conquistas.")
+    parser.add_argument("--size", type=int, default=256, help="lado da badge em pixels (padrao: 256)")
+    parser.add_argument("--supersample", type=int, default=4, help="fator de supersample do desenho (padrao: 4)")
+    parser.add_argument("--matrix", action="store_true", help="renderiza todas as cores x glifos x estados")
+    parser.add_argument("--out", default=os.path.join(ROOT, "src", "CodeGym.UI", "Resources", "badges"),
+                        help="pasta de saida (padrao: src/CodeGym.UI/Resources/badges)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processos (padrao: numero de CPUs; 1 = sem pool)")
+    args = parser.parse_args(argv)
+
+    jobs = badge_jobs(args.size, args.matrix)
+    print(f"Renderizando {len(jobs)} badges {args.size}x{args.size}...")
+    rendered = render_badges(jobs, args.supersample, args.workers, resolve_font())
+
+    os.makedirs(args.out, exist_ok=True)
+    written = sum(write_if_changed(os.path.join(args.out, name), data) for name, data in sorted(rendered.items()))
+    print(f"{written} gravadas, {len(rendered) - written} inalteradas em {args.out}")
+
+
+if __name__ == "__main__":
+    main()
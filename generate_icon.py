@@ -2,192 +2,815 @@
 Gera o icone do CodeGymCraft em alta definicao maxima.
 Renderiza a 2048px com supersampling 4x e faz downscale com LANCZOS.
 O ICO usa compressao PNG interna para tamanhos >= 48px (maxima qualidade).
+
+Uso:
+    python generate_icon.py              # resize direto do master para cada tamanho
+    python generate_icon.py --pyramid    # reduz via piramide 2048->1024->512->...
+    python generate_icon.py --supersample 4   # desenha cada tamanho direto em 4x, sem master
+    python generate_icon.py --report     # compara piramide (ou --supersample) x direto, sem gravar
+    python generate_icon.py --no-cache   # ignora o cache em .icon-cache/
+    python generate_icon.py --manifest icon-assets.json   # ICO, PNGs, instalador e tiles
+    python generate_icon.py --profile fast      # PNG rapido para iterar (compact: release)
+
+O master e os PNGs de cada tamanho ficam em cache no disco (.icon-cache/),
+com chave = hash dos parametros de desenho; rodar de novo sem mudar nada nao
+redesenha nem recodifica nada, e os arquivos de saida so sao regravados
+quando os bytes mudam.
+
+As saidas vem de um manifesto declarativo (DEFAULT_ASSETS ou --manifest):
+cada alvo diz caminho, formato, tamanho e opcoes de fundo/sharpen. Todos os
+alvos saem do mesmo master, em paralelo, e alvos em dia sao pulados.
 """
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
+import PIL
+import filecmp
+import hashlib
+import json
 import struct
+import threading
 import io
+import math
 import os
 
+try:
+    import numpy as np
+except ImportError:  # NumPy e opcional: sem ele o gradiente sai via Pillow puro
+    np = None
+
 SUPERSAMPLE = 2048  # Renderizar em resolucao muito alta
 
 
-def create_master():
-    """Cria o icone master em 2048x2048 com anti-aliasing perfeito."""
-    s = SUPERSAMPLE
-    img = Image.new("RGBA", (s, s), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+def gradient_alpha(height):
+    """
+    Alpha (0..40) de cada linha do gradiente inferior, de cima para baixo.
+    Mesma conta do antigo loop de od.line: int(40 * i / height).
+    """
+    if np is not None:
+        return (np.arange(height, dtype=np.int64) * 40 / height).astype(np.uint8)
+    return bytes(int(40 * i / height) for i in range(height))
 
-    # Fundo arredondado roxo/violeta
-    bg_color = (124, 58, 237)
-    radius = int(s * 0.22)
-    draw.rounded_rectangle([(0, 0), (s - 1, s - 1)], radius=radius, fill=bg_color)
 
-    # Gradiente sutil na parte inferior para profundidade
-    overlay = Image.new("RGBA", (s, s), (0, 0, 0, 0))
-    od = ImageDraw.Draw(overlay)
-    for y in range(s // 2, s):
-        alpha = int(40 * (y - s // 2) / (s // 2))
-        od.line([(0, y), (s, y)], fill=(0, 0, 0, alpha))
-    img = Image.alpha_composite(img, overlay)
-    draw = ImageDraw.Draw(img)
+def gradient_layer(width, height):
+    """Camada RGBA preta com o gradiente vertical no alpha, montada de uma vez."""
+    alpha = gradient_alpha(height)
+    if np is not None:
+        column = Image.fromarray(alpha.reshape(height, 1), "L")
+    else:
+        column = Image.frombytes("L", (1, height), alpha)
+    layer = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    layer.putalpha(column.resize((width, height), Image.NEAREST))
+    return layer
+
+
+def composite_blurred(img, bbox, radius, draw_fn):
+    """
+    Desenha uma sombra desfocada e compoe em img, trabalhando so dentro de
+    bbox + margem do blur (em vez de uma camada do tamanho da imagem inteira).
 
-    # Texto "CG" — usar fonte grande e Bold
-    font_size = int(s * 0.48)
-    font = None
-    # Tentar fontes em ordem de preferencia
-    font_candidates = [
+    O GaussianBlur do Pillow sao 3 passadas de box blur, cada uma com alcance
+    de no maximo ceil(radius) + 1 pixels, entao a margem abaixo cobre todo o
+    borrado e o resultado e identico ao da camada cheia.
+    draw_fn(draw, dx, dy) desenha a forma deslocada por (dx, dy).
+    """
+    pad = 3 * (math.ceil(radius) + 1)
+    x0 = max(0, math.floor(bbox[0]) - pad)
+    y0 = max(0, math.floor(bbox[1]) - pad)
+    x1 = min(img.width, math.ceil(bbox[2]) + pad + 1)
+    y1 = min(img.height, math.ceil(bbox[3]) + pad + 1)
+    layer = Image.new("RGBA", (x1 - x0, y1 - y0), (0, 0, 0, 0))
+    draw_fn(ImageDraw.Draw(layer), -x0, -y0)
+    layer = layer.filter(ImageFilter.GaussianBlur(radius=radius))
+    img.alpha_composite(layer, dest=(x0, y0))
+
+
+# Parametros do desenho. Tudo que muda o master entra aqui (e na chave do cache);
+# medidas sao fracoes do lado do master.
+ICON_PARAMS = {
+    "size": SUPERSAMPLE,
+    "background": (124, 58, 237),       # roxo/violeta
+    "corner_radius": 0.22,
+    "font_candidates": [
         "C:/Windows/Fonts/segoeuib.ttf",   # Segoe UI Bold
         "C:/Windows/Fonts/segoeui.ttf",     # Segoe UI Regular
         "C:/Windows/Fonts/arialbd.ttf",     # Arial Bold
         "C:/Windows/Fonts/calibrib.ttf",    # Calibri Bold
-    ]
-    for name in font_candidates:
+    ],
+    "font_size": 0.48,
+    "text": "CG",
+    "text_lift": 0.025,
+    "text_shadow": {"offset": (4, 6), "blur": 8, "alpha": 60},
+    "check_circle": 0.28,
+    "check_margin": 0.04,
+    "check_shadow": {"blur": 6, "alpha": 40},
+    "check_border": 0.022,
+    "check_color": (34, 197, 94),
+    "check_scale": 0.24,
+    "check_points": [(-1.0, 0.05), (-0.2, 0.75), (1.1, -0.7)],
+    "check_line": 0.032,
+}
+
+# Incrementar quando o codigo de desenho ou de reducao mudar sem mudar ICON_PARAMS
+RENDER_VERSION = 2
+
+
+def resolve_font(params=ICON_PARAMS):
+    """Caminho da primeira fonte candidata que abre, ou None (fonte padrao do Pillow)."""
+    for name in params["font_candidates"]:
         try:
-            font = ImageFont.truetype(name, font_size)
-            break
+            ImageFont.truetype(name, 12)
+            return name
         except (OSError, IOError):
             continue
-    if font is None:
-        font = ImageFont.load_default()
+    return None
+
 
-    text = "CG"
+def text_origin(draw, text, font, s, params=ICON_PARAMS):
+    """(x, y) que centraliza text num lado s, erguido por text_lift como o "CG"."""
     bbox = draw.textbbox((0, 0), text, font=font)
     tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
-    tx = (s - tw) // 2 - bbox[0]
-    ty = (s - th) // 2 - bbox[1] - int(s * 0.025)
+    return (s - tw) // 2 - bbox[0], (s - th) // 2 - bbox[1] - int(s * params["text_lift"])
 
-    # Sombra suave (blur)
-    shadow_layer = Image.new("RGBA", (s, s), (0, 0, 0, 0))
-    sd = ImageDraw.Draw(shadow_layer)
-    sd.text((tx + 4, ty + 6), text, fill=(0, 0, 0, 60), font=font)
-    shadow_layer = shadow_layer.filter(ImageFilter.GaussianBlur(radius=8))
-    img = Image.alpha_composite(img, shadow_layer)
+
+def draw_text_shadow(img, xy, text, font, k, params=ICON_PARAMS):
+    """Sombra desfocada de text desenhado em xy; k = lado / lado do master."""
+    tx, ty = xy
+    sdx, sdy = (round(v * k) for v in params["text_shadow"]["offset"])
+    fill = (0, 0, 0, params["text_shadow"]["alpha"])
+    composite_blurred(
+        img, ImageDraw.Draw(img).textbbox((tx + sdx, ty + sdy), text, font=font), params["text_shadow"]["blur"] * k,
+        lambda d, dx, dy: d.text((tx + sdx + dx, ty + sdy + dy), text, fill=fill, font=font))
+
+
+def status_geometry(s, params=ICON_PARAMS):
+    """
+    Medidas do circulo de status (canto inferior direito) e do check em s x s:
+    caixas do anel branco e do miolo, centro, escala e pontas do check,
+    largura do traco, raio das pontas e deslocamentos da sombra.
+
+    As medidas sao as inteiras do master; em outro lado (modo analitico) elas
+    escalam em float, sem truncar de novo em pixels inteiros, e o circulo
+    pequeno fica no mesmo lugar e tamanho que no master reduzido.
+    """
+    m = params["size"]
+    k = 1 if s == m else s / m  # int no master: as medidas continuam inteiras
+    cs = int(m * params["check_circle"])  # tamanho do circulo
+    cx = cy = m - cs - int(m * params["check_margin"])
+    bw = int(m * params["check_border"])
+    ccx, ccy = cx + cs // 2, cy + cs // 2
+    scale = cs * params["check_scale"]
+    line_w = max(6, int(m * params["check_line"]))
+    return {
+        "circle": (cx * k, cy * k, cs * k),
+        "ring": [((cx - bw) * k, (cy - bw) * k), ((cx + cs + bw) * k, (cy + cs + bw) * k)],
+        "dot": [(cx * k, cy * k), ((cx + cs) * k, (cy + cs) * k)],
+        "center": (ccx * k, ccy * k),
+        "scale": scale * k,
+        "points": [((ccx + scale * px) * k, (ccy + scale * py) * k) for px, py in params["check_points"]],
+        "line_w": max(1, round(line_w * k)),
+        "cap": line_w // 2 * k,
+        "shadow": (2 * k, 4 * k, 8 * k),
+    }
+
+
+def draw_circle_shadow(img, geometry, k, params=ICON_PARAMS):
+    """Sombra desfocada do circulo de status, um pouco abaixo e mais larga que ele."""
+    cx, cy, cs = geometry["circle"]
+    fill = (0, 0, 0, params["check_shadow"]["alpha"])
+    sx, sy0, sy1 = geometry["shadow"]
+    composite_blurred(
+        img, (cx - sx, cy + sy0, cx + cs + sx, cy + cs + sy1), params["check_shadow"]["blur"] * k,
+        lambda d, dx, dy: d.ellipse([(cx - sx + dx, cy + sy0 + dy), (cx + cs + sx + dx, cy + cs + sy1 + dy)],
+                                    fill=fill))
+
+
+def draw_check(draw, geometry, fill=(255, 255, 255)):
+    """Checkmark grosso, com circulos nas pontas para suavizar (line caps)."""
+    p1, p2, p3 = geometry["points"]
+    draw.line([p1, p2], fill=fill, width=geometry["line_w"], joint="curve")
+    draw.line([p2, p3], fill=fill, width=geometry["line_w"], joint="curve")
+    r = geometry["cap"]
+    for p in [p1, p2, p3]:
+        draw.ellipse([(p[0] - r, p[1] - r), (p[0] + r, p[1] + r)], fill=fill)
+
+
+def create_master(params=ICON_PARAMS, font_path=None, size=None):
+    """
+    Cria o icone master em 2048x2048 com anti-aliasing perfeito.
+
+    Toda a geometria e fracao do lado, entao size desenha o mesmo icone em
+    qualquer resolucao (modo analitico: tamanho alvo x fator de supersample).
+    As poucas medidas absolutas (deslocamento e blur das sombras, espessura
+    minima do traco) estao em pixels do master de 2048 e escalam junto.
+    """
+    s = size or params["size"]
+    k = s / params["size"]  # 1.0 no master; medidas absolutas sao multiplicadas por k
+    img = Image.new("RGBA", (s, s), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    # Fundo arredondado roxo/violeta
+    bg_color = tuple(params["background"])
+    radius = int(s * params["corner_radius"])
+    draw.rounded_rectangle([(0, 0), (s - 1, s - 1)], radius=radius, fill=bg_color)
+
+    # Gradiente sutil na parte inferior para profundidade (so a metade de baixo)
+    img.alpha_composite(gradient_layer(s, s - s // 2), dest=(0, s // 2))
     draw = ImageDraw.Draw(img)
 
+    # Texto "CG" — usar fonte grande e Bold (candidatas em ordem de preferencia)
+    font_size = int(s * params["font_size"])
+    if font_path is None:
+        font_path = resolve_font(params)
+    font = ImageFont.truetype(font_path, font_size) if font_path else ImageFont.load_default()
+
+    text = params["text"]
+    tx, ty = text_origin(draw, text, font, s, params)
+
+    # Sombra suave (blur)
+    draw_text_shadow(img, (tx, ty), text, font, k, params)
+
     # Texto branco principal
     draw.text((tx, ty), text, fill=(255, 255, 255, 255), font=font)
 
     # Checkmark verde no canto inferior direito
-    cs = int(s * 0.28)  # tamanho do circulo
-    cx = s - cs - int(s * 0.04)
-    cy = s - cs - int(s * 0.04)
-
-    # Sombra do circulo
-    circle_shadow = Image.new("RGBA", (s, s), (0, 0, 0, 0))
-    csd = ImageDraw.Draw(circle_shadow)
-    csd.ellipse([(cx - 2, cy + 4), (cx + cs + 2, cy + cs + 8)], fill=(0, 0, 0, 40))
-    circle_shadow = circle_shadow.filter(ImageFilter.GaussianBlur(radius=6))
-    img = Image.alpha_composite(img, circle_shadow)
-    draw = ImageDraw.Draw(img)
+    geometry = status_geometry(s, params)
+    draw_circle_shadow(img, geometry, k, params)
 
-    # Borda branca do circulo (ligeiramente maior)
-    bw = int(s * 0.022)
-    draw.ellipse([(cx - bw, cy - bw), (cx + cs + bw, cy + cs + bw)], fill=(255, 255, 255))
-    # Circulo verde
-    draw.ellipse([(cx, cy), (cx + cs, cy + cs)], fill=(34, 197, 94))
+    # Borda branca do circulo (ligeiramente maior) e circulo verde
+    draw.ellipse(geometry["ring"], fill=(255, 255, 255))
+    draw.ellipse(geometry["dot"], fill=tuple(params["check_color"]))
 
     # Checkmark branco dentro do circulo (mais grosso e definido)
-    ccx = cx + cs // 2
-    ccy = cy + cs // 2
-    scale = cs * 0.24
+    draw_check(draw, geometry)
 
-    p1 = (ccx - scale * 1.0, ccy + scale * 0.05)
-    p2 = (ccx - scale * 0.2, ccy + scale * 0.75)
-    p3 = (ccx + scale * 1.1, ccy - scale * 0.7)
+    return img
 
-    line_w = max(6, int(s * 0.032))
-    draw.line([p1, p2], fill=(255, 255, 255), width=line_w, joint="curve")
-    draw.line([p2, p3], fill=(255, 255, 255), width=line_w, joint="curve")
 
-    # Circulos nas pontas para suavizar (line caps)
-    r = line_w // 2
-    for p in [p1, p2, p3]:
-        draw.ellipse([(p[0] - r, p[1] - r), (p[0] + r, p[1] + r)], fill=(255, 255, 255))
+# Perfis de codificacao PNG: cada um tenta as opcoes da lista e fica com o menor.
+#   fast     iteracao local: zlib nivel 1, sem busca de filtro
+#   default  optimize=True (o que sempre foi usado)
+#   compact  release: optimize com as duas estrategias do zlib que rendem algo
+#            aqui e, ate PALETTE_MAX, paleta indexada quando nao perde nada
+ENCODE_PROFILES = {
+    "fast": [{"compress_level": 1}],
+    "default": [{"optimize": True}],
+    "compact": [{"optimize": True}, {"optimize": True, "compress_type": 0}],
+}
+PALETTE_MAX = 48
 
-    return img
 
+def _save_png(img, **options):
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", **options)
+    return buf.getvalue()
 
-def build_ico_with_png(images_dict, output_path):
+
+def palette_png(img):
+    """
+    PNG indexado (paleta RGBA via tRNS) de img, ou None se tiver mais de 256
+    cores. O resultado e decodificado e comparado com o original: so e
+    devolvido se for identico pixel a pixel.
     """
-    Cria um ICO com compressao PNG interna para cada tamanho.
-    Isso resulta em qualidade MUITO superior ao ICO padrao do Pillow
-    que usa BMP sem compressao e perde qualidade.
+    img = img.convert("RGBA")
+    colors = img.getcolors(256)
+    if colors is None:
+        return None
+    palette = sorted(color for _, color in colors)
+    index = {bytes(color): i for i, color in enumerate(palette)}
+    raw = img.tobytes()
+    indexed = Image.frombytes("P", img.size, bytes(index[raw[i:i + 4]] for i in range(0, len(raw), 4)))
+    indexed.putpalette(b"".join(bytes(color[:3]) for color in palette), "RGB")
+    data = _save_png(indexed, optimize=True, transparency=bytes(color[3] for color in palette))
+    if Image.open(io.BytesIO(data)).convert("RGBA").tobytes() != raw:
+        return None
+    return data
+
+
+def encode_png(img, profile="default"):
+    """Salva como PNG em memoria, no perfil pedido (padrao: optimize=True)."""
+    candidates = [_save_png(img, **options) for options in ENCODE_PROFILES[profile]]
+    if profile == "compact" and max(img.size) <= PALETTE_MAX:
+        indexed = palette_png(img)
+        if indexed is not None:
+            candidates.append(indexed)
+    return min(candidates, key=len)  # empate fica com o primeiro: saida deterministica
+
 
-    images_dict: {size: PIL.Image} ex: {16: img16, 32: img32, ...}
+def run_jobs(fn, items, pool=None):
+    """map() no pool de threads, se houver; a ordem do resultado e a de items."""
+    return list(pool.map(fn, items)) if pool is not None else [fn(item) for item in items]
+
+
+def _hash(*parts):
+    return hashlib.sha256("\0".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+def master_key(params=ICON_PARAMS, font_path=None):
+    """
+    Chave do master: parametros de desenho + fonte usada (caminho e hash do
+    arquivo) + versao do Pillow, que muda o rasterizador.
     """
+    font_digest = ""
+    if font_path:
+        with open(font_path, "rb") as f:
+            font_digest = hashlib.sha256(f.read()).hexdigest()
+    return _hash(json.dumps(params, sort_keys=True), font_path, font_digest,
+                 PIL.__version__, RENDER_VERSION)
+
+
+def blob_key(mkey, size, mode, sharpen, profile="default"):
+    """Chave do PNG de um tamanho: master + tamanho + modo de reducao + sharpen + perfil."""
+    return _hash(mkey, size, mode, sharpen, profile)
+
+
+class IconCache:
+    """Cache enderecado por conteudo: master em RGBA cru e PNGs ja codificados."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _write(self, name, data):
+        os.makedirs(self.path, exist_ok=True)
+        tmp = self._file(name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, self._file(name))
+
+    def _read(self, name):
+        try:
+            with open(self._file(name), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def master(self, key):
+        raw = self._read(f"master-{key}.rgba")
+        if raw is None or len(raw) != SUPERSAMPLE * SUPERSAMPLE * 4:
+            return None
+        return Image.frombytes("RGBA", (SUPERSAMPLE, SUPERSAMPLE), raw)
+
+    def put_master(self, key, img):
+        self._write(f"master-{key}.rgba", img.tobytes())
+
+    def blob(self, key):
+        return self._read(f"{key}.png")
+
+    def put_blob(self, key, data):
+        self._write(f"{key}.png", data)
+
+    def stamps(self):
+        """{caminho de saida: {"key", "sha256"}} da ultima execucao."""
+        raw = self._read("targets.json")
+        return json.loads(raw) if raw else {}
+
+    def put_stamps(self, stamps):
+        self._write("targets.json", json.dumps(stamps, indent=2, sort_keys=True).encode("utf-8"))
+
+
+def read_file(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def write_if_changed(path, data):
+    """Grava so se o conteudo mudou. Retorna True se gravou."""
+    if read_file(path) == data:
+        return False
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+def ico_entry(size, length, offset):
+    # ICO entry: width, height (0=256), planes, bpp, size, offset
+    w = 0 if size >= 256 else size
+    h = 0 if size >= 256 else size
+    return struct.pack("<BBBBHHII",
+                       w,          # width (0 = 256+)
+                       h,          # height (0 = 256+)
+                       0,          # color palette
+                       0,          # reserved
+                       1,          # color planes
+                       32,         # bits per pixel
+                       length,     # size of data
+                       offset)     # offset to data
+
+
+def write_ico(f, sizes, blobs):
+    """
+    Escreve um ICO em f (arquivo com seek) sem juntar os PNGs em memoria.
+
+    sizes: tamanhos em ordem crescente; blobs: iteravel com o PNG de cada
+    tamanho, na mesma ordem (pode ser um gerador que codifica sob demanda).
+    O diretorio e reservado no inicio, cada PNG vai para o arquivo assim que
+    chega e, no fim, o diretorio e preenchido com os tamanhos conhecidos.
+    """
+    sizes = list(sizes)
+    start = f.tell()
+    # Header: reserved(2) + type(2, 1=ICO) + count(2), depois o diretorio
+    f.write(struct.pack("<HHH", 0, 1, len(sizes)))
+    f.write(bytes(16 * len(sizes)))
     entries = []
-    data_blocks = []
-    offset = 6 + 16 * len(images_dict)  # header(6) + entries(16 each)
-
-    for size in sorted(images_dict.keys()):
-        img = images_dict[size]
-        # Converter para RGBA
-        img = img.convert("RGBA")
-
-        # Salvar como PNG em memoria
-        buf = io.BytesIO()
-        img.save(buf, format="PNG", optimize=True)
-        png_data = buf.getvalue()
-
-        # ICO entry: width, height (0=256), planes, bpp, size, offset
-        w = 0 if size >= 256 else size
-        h = 0 if size >= 256 else size
-
-        entry = struct.pack("<BBBBHHII",
-                            w,          # width (0 = 256+)
-                            h,          # height (0 = 256+)
-                            0,          # color palette
-                            0,          # reserved
-                            1,          # color planes
-                            32,         # bits per pixel
-                            len(png_data),  # size of data
-                            offset)     # offset to data
-
-        entries.append(entry)
-        data_blocks.append(png_data)
+    offset = 6 + 16 * len(sizes)  # header(6) + entries(16 each)
+    for size, png_data in zip(sizes, blobs):
+        f.write(png_data)
+        entries.append(ico_entry(size, len(png_data), offset))
         offset += len(png_data)
+    if len(entries) != len(sizes):
+        raise ValueError(f"ICO com {len(entries)} PNGs para {len(sizes)} tamanhos.")
+    end = f.tell()
+    f.seek(start + 6)
+    f.write(b"".join(entries))
+    f.seek(end)
+
 
-    # Escrever arquivo ICO
-    with open(output_path, "wb") as f:
-        # Header: reserved(2) + type(2, 1=ICO) + count(2)
-        f.write(struct.pack("<HHH", 0, 1, len(images_dict)))
-        for entry in entries:
-            f.write(entry)
-        for block in data_blocks:
-            f.write(block)
-
-
-# === MAIN ===
-print("Gerando icone master 2048x2048...")
-master = create_master()
-
-# Gerar cada tamanho com LANCZOS de alta qualidade
-sizes = [16, 20, 24, 32, 40, 48, 64, 128, 256]
-images_dict = {}
-for sz in sizes:
-    resized = master.resize((sz, sz), Image.LANCZOS)
+def ico_bytes(blobs):
+    """Monta o ICO a partir de {size: bytes do PNG}, em ordem de tamanho."""
+    sizes = sorted(blobs)
+    buf = io.BytesIO()
+    write_ico(buf, sizes, (blobs[size] for size in sizes))
+    return buf.getvalue()
+
+
+def write_ico_if_changed(path, sizes, blobs):
+    """
+    Grava um ICO com compressao PNG interna para cada tamanho (qualidade
+    muito superior ao ICO padrao do Pillow, que usa BMP sem compressao).
+
+    Os PNGs (blobs, gerador como em write_ico) vao direto para um arquivo
+    temporario, sem juntar o ICO em memoria; o temporario e comparado com o
+    arquivo existente e so o substitui se os bytes mudaram.
+    Retorna (gravou, sha256, tamanho em bytes).
+    """
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w+b") as f:
+            write_ico(f, sizes, blobs)
+            length = f.tell()
+            f.seek(0)
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+        if os.path.exists(path) and filecmp.cmp(tmp, path, shallow=False):
+            os.remove(tmp)
+            return False, digest.hexdigest(), length
+        os.replace(tmp, path)
+        return True, digest.hexdigest(), length
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def build_pyramid(master, min_size):
+    """
+    Piramide de resolucao: master, master/2, master/4, ... ate o menor nivel
+    ainda >= min_size. Cada nivel sai do anterior (LANCZOS 2:1), entao quase
+    todo o trabalho roda em imagens pequenas.
+    """
+    levels = {master.width: master}
+    img = master
+    while img.width // 2 >= min_size:
+        img = img.resize((img.width // 2, img.height // 2), Image.LANCZOS)
+        levels[img.width] = img
+    return levels
+
+
+def resize_from_pyramid(levels, size):
+    """LANCZOS final a partir do menor nivel da piramide que ainda e >= size."""
+    level = min(lv for lv in levels if lv >= size)
+    img = levels[level]
+    return img.copy() if level == size else img.resize((size, size), Image.LANCZOS)
+
+
+def render_sizes(master, sizes, pyramid=False, pool=None):
+    """{tamanho: imagem} sem sharpen, por resize direto do master ou via piramide."""
+    if not pyramid:
+        return dict(zip(sizes, run_jobs(lambda sz: master.resize((sz, sz), Image.LANCZOS), sizes, pool)))
+    levels = build_pyramid(master, min(sizes))
+    return dict(zip(sizes, run_jobs(lambda sz: resize_from_pyramid(levels, sz), sizes, pool)))
+
+
+def render_analytic(size, factor, font_path=None):
+    """
+    Desenha o icone direto em size x factor e reduz com LANCZOS para size.
+    Nao passa pelo master de 2048px: um 16px com fator 4 desenha 64x64. O
+    desenho nunca passa do tamanho do master (1024 com fator 4 desenha 2048).
+    """
+    factor = max(1, min(factor, SUPERSAMPLE // size))
+    img = create_master(font_path=font_path, size=size * factor)
+    return img if factor == 1 else img.resize((size, size), Image.LANCZOS)
+
+
+def finish(img, size):
     # Aplicar leve sharpen nos tamanhos pequenos para manter nitidez
-    if sz <= 48:
-        resized = resized.filter(ImageFilter.SHARPEN)
-    images_dict[sz] = resized
-    print(f"  {sz}x{sz} OK")
-
-# Salvar ICO com compressao PNG interna (qualidade maxima)
-ico_path = os.path.join(os.path.dirname(__file__), "src", "CodeGym.UI", "Resources", "icon.ico")
-build_ico_with_png(images_dict, ico_path)
-print(f"ICO (PNG-compressed): {ico_path}")
-
-# Salvar PNG 256px
-png_path = os.path.join(os.path.dirname(__file__), "src", "CodeGym.UI", "Resources", "icon.png")
-master.resize((256, 256), Image.LANCZOS).save(png_path, optimize=True)
-print(f"PNG 256: {png_path}")
-
-# Salvar PNG 1024px para referencia
-png_hd = os.path.join(os.path.dirname(__file__), "src", "CodeGym.UI", "Resources", "icon_hd.png")
-master.resize((1024, 1024), Image.LANCZOS).save(png_hd, optimize=True)
-print(f"PNG 1024: {png_hd}")
-
-# Verificar tamanho do ICO
-ico_size = os.path.getsize(ico_path)
-print(f"\nICO file size: {ico_size:,} bytes ({ico_size/1024:.1f} KB)")
-print("Done!")
+    return img.filter(ImageFilter.SHARPEN) if size <= SHARPEN_MAX else img
+
+
+def quality_report(master, sizes, candidate=None):
+    """
+    Compara um modo (padrao: piramide) x resize direto do master: erro
+    maximo/medio por canal e PSNR. candidate: {tamanho: imagem sem sharpen}.
+    """
+    from PIL import ImageChops, ImageStat
+
+    direct = render_sizes(master, sizes)
+    pyr = candidate if candidate is not None else render_sizes(master, sizes, pyramid=True)
+    print(f"{'size':>6} {'max':>5} {'mean':>8} {'psnr(dB)':>9}")
+    for sz in sizes:
+        # Compara em alpha pre-multiplicado: cor de pixel transparente nao aparece
+        diff = ImageChops.difference(finish(direct[sz], sz).convert("RGBa"), finish(pyr[sz], sz).convert("RGBa"))
+        max_err = max(hi for _, hi in diff.getextrema())
+        stat = ImageStat.Stat(diff)
+        mean = sum(stat.mean) / len(stat.mean)
+        mse = sum(stat.sum2) / (len(stat.sum2) * sz * sz)
+        psnr = float("inf") if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+        print(f"{sz:>6} {max_err:>5} {mean:>8.4f} {psnr:>9.2f}")
+
+
+ICO_SIZES = [16, 20, 24, 32, 40, 48, 64, 128, 256]
+SHARPEN_MAX = 48
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT, ".icon-cache")
+
+# Alvos padrao (caminhos relativos a raiz do repo). Outros manifestos, no mesmo
+# formato, entram com --manifest (ex.: icon-assets.json, com instalador e tiles).
+#   path        caminho de saida
+#   format      "ico", "png" ou "bmp"
+#   sizes       (ico) tamanhos das entradas
+#   size        (png/bmp) lado ou [largura, altura]
+#   icon        lado do icone dentro da imagem (padrao: o menor lado), centralizado
+#   background  cor de fundo "#RRGGBB" (padrao: transparente; branco em bmp)
+#   sharpen     forca/desliga o sharpen (padrao: tamanhos <= SHARPEN_MAX)
+DEFAULT_ASSETS = [
+    {"path": "src/CodeGym.UI/Resources/icon.ico", "format": "ico", "sizes": ICO_SIZES},
+    {"path": "src/CodeGym.UI/Resources/icon.png", "format": "png", "size": 256},
+    {"path": "src/CodeGym.UI/Resources/icon_hd.png", "format": "png", "size": 1024},
+]
+FORMATS = ("ico", "png", "bmp")
+
+
+def load_assets(path):
+    """Le um manifesto JSON: lista de alvos ou {"targets": [...]}."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    targets = data["targets"] if isinstance(data, dict) else data
+    for target in targets:
+        if not target.get("path"):
+            raise ValueError(f"Alvo sem 'path' em {path}: {target}")
+        if target.get("format") not in FORMATS:
+            raise ValueError(f"Formato invalido em {target['path']}: {target.get('format')!r} (use {', '.join(FORMATS)})")
+        if ("sizes" if target["format"] == "ico" else "size") not in target:
+            raise ValueError(f"Alvo sem tamanho: {target['path']}")
+    return targets
+
+
+def parse_color(value):
+    """'#RRGGBB' ou [r, g, b] -> tupla RGBA; None fica None (transparente)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.lstrip("#")
+        return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4)) + (255,)
+    return tuple(value[:3]) + (255,)
+
+
+class IconSource:
+    """
+    PNGs e imagens do icone por tamanho, todos saidos de um unico master (ou
+    do modo analitico) e do cache. Seguro entre threads: cada tamanho e
+    desenhado e codificado uma vez so, mesmo que varios alvos peçam ao mesmo
+    tempo.
+    """
+
+    def __init__(self, mkey, mode, font_path, cache=None, supersample=None, profile="default"):
+        self.mkey = mkey
+        self.mode = mode
+        self.profile = profile
+        self.font_path = font_path
+        self.cache = cache
+        self.supersample = supersample
+        self.rendered = []  # tamanhos desenhados nesta execucao (o resto veio do cache)
+        self._lock = threading.Lock()
+        self._locks = {}
+        self._blobs = {}
+        self._master = None
+        self._levels = None
+
+    def master(self):
+        with self._lock:
+            if self._master is None:
+                self._master = self.cache.master(self.mkey) if self.cache else None
+                if self._master is not None:
+                    print("Master 2048x2048 do cache")
+                else:
+                    print("Gerando icone master 2048x2048...")
+                    self._master = create_master(font_path=self.font_path)
+                    if self.cache:
+                        self.cache.put_master(self.mkey, self._master)
+            return self._master
+
+    def _resized(self, size):
+        if self.supersample:
+            return render_analytic(size, self.supersample, self.font_path)
+        master = self.master()
+        if self.mode != "pyramid":
+            return master.resize((size, size), Image.LANCZOS)
+        with self._lock:
+            if self._levels is None:
+                self._levels = build_pyramid(master, min(ICO_SIZES))
+        return resize_from_pyramid(self._levels, size)
+
+    def blob(self, size, sharpen=None):
+        """Bytes do PNG (RGBA) do icone em size x size."""
+        if sharpen is None:
+            sharpen = size <= SHARPEN_MAX
+        key = blob_key(self.mkey, size, self.mode, sharpen, self.profile)
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._blobs:
+                blob = self.cache.blob(key) if self.cache else None
+                if blob is None:
+                    img = self._resized(size)
+                    if sharpen:
+                        img = img.filter(ImageFilter.SHARPEN)
+                    blob = encode_png(img.convert("RGBA"), self.profile)
+                    if self.cache:
+                        self.cache.put_blob(key, blob)
+                    self.rendered.append(size)
+                self._blobs[key] = blob
+            return self._blobs[key]
+
+    def image(self, size, sharpen=None):
+        return Image.open(io.BytesIO(self.blob(size, sharpen))).convert("RGBA")
+
+
+def _dims(size):
+    return (size, size) if isinstance(size, int) else tuple(size)
+
+
+def target_blobs(target):
+    """(tamanho, sharpen) de cada PNG do icone que o alvo usa."""
+    sharpen = target.get("sharpen")
+    if target["format"] == "ico":
+        return [(sz, sharpen) for sz in target["sizes"]]
+    width, height = _dims(target["size"])
+    return [(target.get("icon", min(width, height)), sharpen)]
+
+
+def render_target(target, source):
+    """Bytes de um alvo png ou bmp do manifesto (o ICO sai em streaming, em write_target)."""
+    fmt = target["format"]
+    sharpen = target.get("sharpen")
+    width, height = _dims(target["size"])
+    icon = target.get("icon", min(width, height))
+    background = parse_color(target.get("background"))
+    if fmt == "png" and background is None and width == height == icon:
+        return source.blob(icon, sharpen)
+
+    if background is None and fmt == "bmp":
+        background = (255, 255, 255, 255)
+    canvas = Image.new("RGBA", (width, height), background or (0, 0, 0, 0))
+    canvas.alpha_composite(source.image(icon, sharpen), dest=((width - icon) // 2, (height - icon) // 2))
+    if fmt == "png":
+        return encode_png(canvas, source.profile)
+    buf = io.BytesIO()
+    canvas.convert("RGB").save(buf, format="BMP")
+    return buf.getvalue()
+
+
+def write_target(target, source, path):
+    """Grava um alvo se os bytes mudaram. Retorna (gravou, sha256, tamanho em bytes)."""
+    if target["format"] == "ico":
+        sizes = sorted(target["sizes"])
+        sharpen = target.get("sharpen")
+        return write_ico_if_changed(path, sizes, (source.blob(sz, sharpen) for sz in sizes))
+    data = render_target(target, source)
+    return write_if_changed(path, data), hashlib.sha256(data).hexdigest(), len(data)
+
+
+def target_key(source, target):
+    return _hash(source.mkey, source.mode, source.profile, json.dumps(target, sort_keys=True))
+
+
+def build_assets(targets, source, root, stamps=None, pool=None):
+    """
+    Renderiza os alvos (em paralelo, se houver pool) e grava os que mudaram.
+
+    stamps: {caminho: {"key", "sha256"}} da ultima execucao. Alvo cujo arquivo
+    ainda tem o sha256 gravado e cuja chave nao mudou e pulado sem renderizar.
+    Retorna [(alvo, caminho, status, tamanho em bytes)] na ordem do manifesto e
+    atualiza stamps.
+    """
+    stamps = {} if stamps is None else stamps
+
+    def check(target):
+        path = os.path.join(root, target["path"])
+        key = target_key(source, target)
+        current = read_file(path)
+        if current is None:
+            return target, path, key, None
+        digest = hashlib.sha256(current).hexdigest()
+        fresh = stamps.get(path) == {"key": key, "sha256": digest}
+        return target, path, key, (digest, len(current)) if fresh else None
+
+    checked = [check(target) for target in targets]
+    # Cada tamanho e uma tarefa do pool (o ICO de 9 tamanhos nao fica serial
+    # dentro de um alvo); os maiores primeiro, que sao os mais caros.
+    jobs = dict.fromkeys(job for target, _, _, fresh in checked if fresh is None for job in target_blobs(target))
+    run_jobs(lambda job: source.blob(*job), sorted(jobs, key=lambda job: -job[0]), pool)
+
+    def build(item):
+        target, path, key, fresh = item
+        if fresh is not None:
+            return (target, path, "em dia", *fresh, key)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        written, digest, length = write_target(target, source, path)
+        return target, path, "gravado" if written else "inalterado", digest, length, key
+
+    results = []
+    for target, path, status, digest, length, key in run_jobs(build, checked, pool):
+        stamps[path] = {"key": key, "sha256": digest}
+        results.append((target, path, status, length))
+    return results
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gera o icone do CodeGymCraft.")
+    parser.add_argument("--pyramid", action="store_true",
+                        help="reduz via piramide 2048->1024->512->... em vez de resize direto do master")
+    parser.add_argument("--supersample", type=int, metavar="N",
+                        help="desenha cada tamanho direto em tamanho x N (sem master de 2048px)")
+    parser.add_argument("--report", action="store_true",
+                        help="so compara piramide (ou --supersample) x resize direto (nao grava nada)")
+    parser.add_argument("--profile", choices=sorted(ENCODE_PROFILES), default="default",
+                        help="codificacao PNG: fast (dev), default ou compact (release)")
+    parser.add_argument("--manifest", metavar="JSON",
+                        help="manifesto de alvos (padrao: icon.ico, icon.png e icon_hd.png em Resources)")
+    parser.add_argument("--out", default=ROOT,
+                        help="raiz dos caminhos do manifesto (padrao: raiz do repo)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="threads para resize/encode (padrao: numero de CPUs; 1 = serial)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="ignora o cache em .icon-cache/ (sempre redesenha e recodifica)")
+    args = parser.parse_args(argv)
+
+    if args.supersample is not None and args.supersample < 1:
+        parser.error("--supersample precisa ser >= 1")
+    if args.supersample:
+        mode = f"analytic-{args.supersample}"
+    else:
+        mode = "pyramid" if args.pyramid else "direct"
+
+    cache = None if args.no_cache else IconCache(CACHE_DIR)
+    font_path = resolve_font()
+    source = IconSource(master_key(font_path=font_path), mode, font_path, cache, args.supersample, args.profile)
+
+    if args.report:
+        sizes = sorted(set(ICO_SIZES + [1024]))
+        candidate = None
+        if args.supersample:
+            candidate = {sz: render_analytic(sz, args.supersample, font_path) for sz in sizes}
+        quality_report(source.master(), sizes, candidate)
+        return
+
+    try:
+        targets = load_assets(args.manifest) if args.manifest else DEFAULT_ASSETS
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    stamps = cache.stamps() if cache else {}
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        results = build_assets(targets, source, args.out, stamps, pool)
+    if cache:
+        cache.put_stamps(stamps)
+
+    for sz in sorted(set(source.rendered)):
+        print(f"  {sz}x{sz} OK")
+    for target, path, status, length in results:
+        label = target["format"].upper()
+        if target["format"] != "ico":
+            label += " {}x{}".format(*_dims(target["size"]))
+        suffix = "" if status == "gravado" else f" ({status})"
+        print(f"{label}: {path}{suffix}")
+
+    # Verificar tamanho do ICO
+    for target, path, status, length in results:
+        if target["format"] == "ico":
+            print(f"\nICO file size: {length:,} bytes ({length/1024:.1f} KB)")
+    print("Done!")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,4 +31,27 @@ public class PackageManifest
     /// <summary>Lista de IDs dos desafios incluídos (referencia arquivos em challenges/).</summary>
     [JsonPropertyName("challenges")]
     public List<string> Challenges { get; set; } = new();
+
+    /// <summary>Hash SHA-256 e tamanho de cada desafio, por ID (opcional, gerado pelo build).</summary>
+    [JsonPropertyName("checksums")]
+    public Dictionary<string, ChallengeChecksum> Checksums { get; set; } = new();
+
+    /// <summary>Digest SHA-256 do pacote inteiro (opcional). Muda sempre que algum desafio muda.</summary>
+    [JsonPropertyName("digest")]
+    public string Digest { get; set; } = string.Empty;
+}
+
+/// <summary>
+/// Hash e tamanho em bytes do arquivo JSON de um desafio.
+/// Permite ao importador pular desafios que não mudaram.
+/// </summary>
+public class ChallengeChecksum
+{
+    /// <summary>SHA-256 (hex, minúsculo) dos bytes do arquivo challenges/{id}.json.</summary>
+    [JsonPropertyName("sha256")]
+    public string Sha256 { get; set; } = string.Empty;
+
+    /// <summary>Tamanho do arquivo em bytes.</summary>
+    [JsonPropertyName("size")]
+    public long Size { get; set; }
 }